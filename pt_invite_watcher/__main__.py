@@ -1,52 +1,124 @@
-import argparse
-import asyncio
-import logging
-import sys
-from typing import Optional
-
-import uvicorn
+from __future__ import annotations
 
-from pt_invite_watcher.app import app
-from pt_invite_watcher.config import load_settings
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+    from typing import Optional
+
+
+_FAST_OPTIONS = {
+    "run": {"--host": str, "--port": int},
+    "check-once": {"--config": str},
+}
+
+
+def _fast_parse_args(argv: list[str]) -> Optional[SimpleNamespace]:
+    """Parse the common invocations without argparse; None means fall back."""
+    if not argv or argv[0] not in _FAST_OPTIONS:
+        return None
+    cmd = argv[0]
+    options = _FAST_OPTIONS[cmd]
+    values: dict[str, object] = {opt[2:]: None for opt in options}
+    rest = argv[1:]
+    i = 0
+    while i < len(rest):
+        token = rest[i]
+        opt, sep, value = token.partition("=")
+        if opt not in options:
+            return None
+        if not sep:
+            i += 1
+            if i >= len(rest):
+                return None
+            value = rest[i]
+        try:
+            values[opt[2:]] = options[opt](value)
+        except ValueError:
+            return None
+        i += 1
+    func = _cmd_run if cmd == "run" else _cmd_check_once
+    return SimpleNamespace(cmd=cmd, func=func, **values)
 
 
 def _parse_args(argv: list[str]) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(prog="pt-invite-watcher")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
     run = sub.add_parser("run", help="Run web UI + scheduler")
     run.add_argument("--host", default=None)
     run.add_argument("--port", type=int, default=None)
+    run.set_defaults(func=_cmd_run)
 
     check = sub.add_parser("check-once", help="Run one scan cycle and exit")
     check.add_argument("--config", default=None, help="Path to config yaml (optional)")
+    check.set_defaults(func=_cmd_check_once)
 
     return parser.parse_args(argv)
 
 
 async def _check_once(config_path: Optional[str]) -> None:
-    from pt_invite_watcher.app_context import build_context
+    import logging
 
-    settings = load_settings(config_path=config_path)
-    logging.basicConfig(level=getattr(logging, settings.log_level, logging.INFO))
-    ctx = await build_context(settings)
-    await ctx.scanner.run_once()
+    from pt_invite_watcher.app_context import build_scanner
+    from pt_invite_watcher.config import load_settings
+    from pt_invite_watcher.storage.sqlite import SqliteStore
 
+    settings = load_settings(config_path=config_path)
+    logging.basicConfig(level=settings.log_level_int)
+    store = SqliteStore(settings.db.path)
+    await store.init()
+    try:
+        scanner = build_scanner(settings, store)
+        await scanner.run_once()
+    finally:
+        await store.close()
+
+
+def _cmd_run(args: argparse.Namespace) -> None:
+    from importlib.util import find_spec
+
+    import uvicorn
+
+    from pt_invite_watcher.app import app
+    from pt_invite_watcher.config import load_settings
+
+    settings = load_settings()
+    host = args.host or settings.web.host
+    port = args.port or settings.web.port
+
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level=settings.log_level.lower(),
+        loop="uvloop" if find_spec("uvloop") is not None else "asyncio",
+        http="httptools" if find_spec("httptools") is not None else "h11",
+        interface="asgi3",
+        lifespan="on",
+    )
+    uvicorn.Server(config).run()
+
+
+def _cmd_check_once(args: argparse.Namespace) -> None:
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop is optional (not available on Windows)
+        import asyncio
 
-def main(argv: Optional[list[str]] = None) -> None:
-    args = _parse_args(argv or sys.argv[1:])
-    if args.cmd == "run":
-        settings = load_settings()
-        host = args.host or settings.web.host
-        port = args.port or settings.web.port
-        uvicorn.run(app, host=host, port=port, log_level=settings.log_level.lower())
-        return
-
-    if args.cmd == "check-once":
         asyncio.run(_check_once(config_path=args.config))
-        return
+    else:
+        uvloop.run(_check_once(config_path=args.config))
 
-    raise SystemExit(2)
+
+def main(argv: Optional[list[str]] = None) -> None:
+    argv = argv or sys.argv[1:]
+    args = _fast_parse_args(argv) or _parse_args(argv)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Dict, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urlparse
 
-from fastapi import Body, Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse
+from fastapi import APIRouter, Body, Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from contextlib import asynccontextmanager
-import json
+
+import orjson
 
 from pt_invite_watcher.app_context import AppContext, build_context
 from pt_invite_watcher.config import Settings, load_settings
@@ -41,7 +46,7 @@ from pt_invite_watcher.providers.deps_status import (
     update_dep_ok,
 )
 from pt_invite_watcher.models import Site
-from pt_invite_watcher.site_list import SITE_LIST_SUMMARY_KEY
+from pt_invite_watcher.site_list import SITE_LIST_SUMMARY_KEY, TEMPLATE_DEFAULT_PATHS, join_url
 
 
 logger = logging.getLogger("pt_invite_watcher")
@@ -50,9 +55,11 @@ logger = logging.getLogger("pt_invite_watcher")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     settings = load_settings()
-    logging.basicConfig(level=getattr(logging, settings.log_level, logging.INFO))
+    logging.basicConfig(level=settings.log_level_int)
     ctx = await build_context(settings)
     app.state.ctx = ctx
+    app.state.auth = _auth_state(settings)
+    app.state.spa_shell = _load_spa_shell()
 
     # Wire up logs to WebSocket
     def _on_log_event(event: Dict[str, Any]) -> None:
@@ -60,6 +67,9 @@ async def lifespan(app: FastAPI):
 
     ctx.store.on_event(_on_log_event)
 
+    scan_wakeup = asyncio.Event()
+    app.state.scan_wakeup = scan_wakeup
+
     async def _loop() -> None:
         try:
             probe_status = await ctx.scanner.probe_dependencies()
@@ -74,28 +84,49 @@ async def lifespan(app: FastAPI):
                     logger.info("scan status: %s", status)
                 except Exception:
                     logger.exception("scan cycle failed")
-
-                interval = ctx.settings.scan.interval_seconds
-                try:
-                    cfg = await ctx.store.get_json("app_config", default={}) or {}
-                    scan_cfg = cfg.get("scan") if isinstance(cfg, dict) else None
-                    if isinstance(scan_cfg, dict) and scan_cfg.get("interval_seconds") is not None:
-                        interval = int(scan_cfg.get("interval_seconds") or interval)
-                except Exception:
-                    pass
-                await asyncio.sleep(max(30, int(interval or 600)))
+                app.state.last_scan_monotonic = time.monotonic()
+
+                # Sleep until the interval elapses; a config change sets scan_wakeup so the new
+                # interval is applied to the current wait instead of after the old one, and a
+                # manual full scan moves last_scan_monotonic so the next cycle counts from it.
+                while True:
+                    interval = await _scan_interval_seconds(ctx)
+                    remaining = interval - (time.monotonic() - app.state.last_scan_monotonic)
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(scan_wakeup.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    finally:
+                        scan_wakeup.clear()
         except asyncio.CancelledError:
             logger.info("scan loop cancelled")
             raise
 
     scan_task = asyncio.create_task(_loop())
-    yield
-    scan_task.cancel()
+    app.state.scan_task = scan_task
     try:
-        await scan_task
-    except asyncio.CancelledError:
-        pass
-    await ctx.store.close()
+        yield
+    finally:
+        # Runs even if the server aborts mid-serve: stop the loop, let in-flight background writes
+        # land, then close the store.
+        scan_task.cancel()
+        await asyncio.gather(scan_task, return_exceptions=True)
+        if ctx.background_tasks:
+            # Bounded: a summary sync can sit in notification retries for a long time.
+            _, pending = await asyncio.wait(tuple(ctx.background_tasks), timeout=_BACKGROUND_DRAIN_TIMEOUT_SECONDS)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        # Queued writes whose flush task never got to run (or was cancelled above).
+        while ctx.pending_json_writes:
+            key, value = ctx.pending_json_writes.popitem()
+            try:
+                await ctx.store.set_json(key, value)
+            except Exception:
+                logger.exception("failed to persist %s", key)
+        await ctx.store.close()
 
 
 app = FastAPI(title="PT Invite Watcher", version=__version__, lifespan=lifespan)
@@ -107,35 +138,73 @@ _ASSETS_DIR = _DIST_DIR / "assets"
 _BACKUP_VERSION = 1
 _SCAN_HINT_KEY = "scan_hint"
 
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class _HashedAssetFiles(StaticFiles):
+    # Vite emits content-hashed file names, so a given asset URL never changes content.
+    async def get_response(self, path: str, scope: Any) -> Any:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL
+        return response
+
+
 # Serve Vite build assets. We intentionally don't require auth here; the SPA entry and APIs are protected.
-app.mount("/assets", StaticFiles(directory=_ASSETS_DIR.as_posix(), check_dir=False), name="assets")
+app.mount("/assets", _HashedAssetFiles(directory=_ASSETS_DIR.as_posix(), check_dir=False), name="assets")
 
 _MAX_ERROR_DETAIL_LEN = 240
 _DEFAULT_REQUEST_RETRY_DELAY_SECONDS = 30
+_WS_SEND_TIMEOUT_SECONDS = 5.0
+_BACKGROUND_DRAIN_TIMEOUT_SECONDS = 5.0
+
+_BOOL_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+_VALID_TEMPLATES = frozenset({"nexusphp", "custom", "mteam"})
+_VALID_COOKIE_SOURCES = frozenset({"auto", "cookiecloud", "moviepilot"})
+_BACKUP_IMPORT_MODES = frozenset({"merge", "replace"})
 
 
 # WebSocket Broadcaster for real-time updates
 class WebSocketBroadcaster:
     def __init__(self):
-        self._clients: list[WebSocket] = []
+        self._clients: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self._clients.append(websocket)
+        self._clients.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self._clients:
-            self._clients.remove(websocket)
+        self._clients.discard(websocket)
+
+    async def _send(self, client: WebSocket, frame: str) -> None:
+        try:
+            await asyncio.wait_for(client.send_text(frame), timeout=_WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            # Failed or stalled (peer not draining): drop it and close so the UI reconnects.
+            self.disconnect(client)
+            asyncio.ensure_future(self._close_quietly(client))
+
+    @staticmethod
+    async def _close_quietly(client: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(client.close(), timeout=_WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    async def broadcast_many(self, topics: list[str]):
+        # One "invalidate" frame replaces a separate "<topic>_update" frame per topic.
+        await self.broadcast({"type": "invalidate", "data": {"topics": topics}})
 
     async def broadcast(self, message: dict):
-        for client in self._clients:
-            try:
-                await client.send_json(message)
-            except Exception:
-                # If sending fails, assume disconnected and remove
-                self.disconnect(client)
+        # Serialize once per broadcast rather than once per client.
+        frame = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        # Send concurrently so one slow client can't hold up the rest; snapshot the set since
+        # failing clients are removed while the sends are in flight.
+        await asyncio.gather(*(self._send(client, frame) for client in tuple(self._clients)))
+
 
 ws_broadcaster = WebSocketBroadcaster()
+_WS_CONNECTED_FRAME = orjson.dumps({"type": "connected"}).decode()
 
 
 def _cfg_str(value: Any) -> str:
@@ -144,7 +213,7 @@ def _cfg_str(value: Any) -> str:
     return str(value).strip()
 
 
-def _cfg_int(value: Any, default: int, min_value: int, max_value: int) -> int:
+def _cfg_int_impl(value: Any, default: int, min_value: int, max_value: int) -> int:
     if value is None or value == "":
         return default
     try:
@@ -154,18 +223,46 @@ def _cfg_int(value: Any, default: int, min_value: int, max_value: int) -> int:
     return max(min_value, min(max_value, parsed))
 
 
-def _cfg_bool(value: Any, default: bool) -> bool:
+def _cfg_bool_impl(value: Any, default: bool) -> bool:
     if value is None or value == "":
         return default
     if isinstance(value, bool):
         return value
     if isinstance(value, int):
         return value != 0
-    return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
+    return str(value).strip().lower() in _BOOL_TRUE
+
+
+# Config values repeat across requests; typed=True keeps True/1/"1" as distinct cache keys.
+_cfg_int_cached = lru_cache(maxsize=512, typed=True)(_cfg_int_impl)
+_cfg_bool_cached = lru_cache(maxsize=512, typed=True)(_cfg_bool_impl)
+
+
+def _cfg_int(value: Any, default: int, min_value: int, max_value: int) -> int:
+    try:
+        return _cfg_int_cached(value, default, min_value, max_value)
+    except TypeError:  # unhashable value (list/dict) from a malformed config
+        return _cfg_int_impl(value, default, min_value, max_value)
+
+
+def _cfg_bool(value: Any, default: bool) -> bool:
+    try:
+        return _cfg_bool_cached(value, default)
+    except TypeError:  # unhashable value (list/dict) from a malformed config
+        return _cfg_bool_impl(value, default)
 
 
 def _safe_dict(value: Any) -> Dict[str, Any]:
-    return value if isinstance(value, dict) else {}
+    # Exact class check: stored/payload JSON only ever decodes to plain dicts, and this skips isinstance's MRO walk.
+    return value if value.__class__ is dict else {}
+
+
+def _apply_str_fields(src: Dict[str, Any], dst: Dict[str, Any], *fields: str) -> None:
+    # Copy the non-empty (stripped) string fields; blank inputs keep the stored value (e.g. secrets).
+    for field in fields:
+        value = _cfg_str(src.get(field))
+        if value:
+            dst[field] = value
 
 
 def _format_error_detail(exc: Exception) -> str:
@@ -182,13 +279,20 @@ def _format_error_detail(exc: Exception) -> str:
     return msg
 
 
+@lru_cache(maxsize=4096)
 def _normalize_domain(domain: str) -> str:
     return (domain or "").strip().lower()
 
 
+@lru_cache(maxsize=4096)
+def _parsed_url(url: str) -> ParseResult:
+    # ParseResult is an immutable namedtuple, so sharing cached instances is safe.
+    return urlparse(url)
+
+
 def _domain_from_url(url: str) -> str:
     try:
-        host = urlparse(url).hostname
+        host = _parsed_url(url).hostname
         return _normalize_domain(host or "")
     except Exception:
         return ""
@@ -204,8 +308,8 @@ def _hosts_related(host_a: str, host_b: str) -> bool:
 
 def _relative_path_from_page_url(page_url: str, site_url: str, *, label: str) -> str:
     try:
-        p = urlparse(page_url)
-        site_host = urlparse(site_url).hostname or ""
+        p = _parsed_url(page_url)
+        site_host = _parsed_url(site_url).hostname or ""
         page_host = p.hostname or ""
         if site_host and page_host and not _hosts_related(site_host, page_host):
             raise ValueError(f"{label} host mismatch: {page_host} (site={site_host})")
@@ -221,8 +325,71 @@ def _relative_path_from_page_url(page_url: str, site_url: str, *, label: str) ->
 
 
 async def _load_app_config(ctx: AppContext) -> Dict[str, Any]:
-    cfg = await ctx.store.get_json("app_config", default={}) or {}
-    return _safe_dict(cfg)
+    # Shared with other readers of the store's kv cache: callers must treat the result as read-only.
+    return _safe_dict(await ctx.store.get_json_cached("app_config", default={}) or {})
+
+
+async def _load_notifications_config(ctx: AppContext) -> Dict[str, Any]:
+    # Read-only for callers, like _load_app_config.
+    return _safe_dict(await ctx.store.get_json_cached("notifications", default=None))
+
+
+async def _scan_interval_seconds(ctx: AppContext) -> int:
+    interval = ctx.settings.scan.interval_seconds
+    try:
+        cfg = await _load_app_config(ctx)
+        scan_cfg = cfg.get("scan")
+        if isinstance(scan_cfg, dict) and scan_cfg.get("interval_seconds") is not None:
+            interval = int(scan_cfg.get("interval_seconds") or interval)
+    except Exception:
+        pass
+    return max(30, int(interval or 600))
+
+
+async def _add_event_quietly(ctx: AppContext, **kwargs: Any) -> None:
+    # Event logging is best-effort; lets callers batch it with other writes via gather().
+    try:
+        await ctx.store.add_event(**kwargs)
+    except Exception:
+        pass
+
+
+def _spawn_background(ctx: AppContext, coro: Any) -> asyncio.Task:
+    # Keep a reference until done (the loop only holds weak ones); lifespan drains these on shutdown.
+    task = asyncio.create_task(coro)
+    ctx.background_tasks.add(task)
+    task.add_done_callback(ctx.background_tasks.discard)
+    return task
+
+
+def _persist_json_later(ctx: AppContext, key: str, value: Any) -> None:
+    # Bookkeeping writes (deps status, MP sites cache) don't need to hold up the response.
+    # Updates to a key that is still queued replace the queued value, so only the latest is written.
+    queued = key in ctx.pending_json_writes
+    ctx.pending_json_writes[key] = value
+    if queued:
+        return
+    _spawn_background(ctx, _flush_json_write(ctx, key))
+
+
+async def _flush_json_write(ctx: AppContext, key: str) -> None:
+    value = ctx.pending_json_writes.pop(key)
+    try:
+        await ctx.store.set_json(key, value)
+    except Exception:
+        logger.exception("failed to persist %s", key)
+
+
+def _wake_scan_loop() -> None:
+    wakeup: Optional[asyncio.Event] = getattr(app.state, "scan_wakeup", None)
+    if wakeup is not None:
+        wakeup.set()
+
+
+def _restart_scan_interval() -> None:
+    # A full scan just ran on demand; don't let the scheduler repeat it moments later.
+    app.state.last_scan_monotonic = time.monotonic()
+    _wake_scan_loop()
 
 
 async def _load_sites_config(ctx: AppContext) -> Dict[str, Any]:
@@ -238,15 +405,81 @@ def _site_entry_view(entry: Dict[str, Any], base_url: str) -> Dict[str, Any]:
     inv_path = _cfg_str(entry.get("invite_path"))
     return {
         "mode": _cfg_str(entry.get("mode")) or "manual",
-        "template": template if template in {"nexusphp", "custom", "mteam"} else "nexusphp",
+        "template": template if template in _VALID_TEMPLATES else "nexusphp",
         "cookie_configured": bool(_cfg_str(entry.get("cookie"))),
         "authorization_configured": bool(_cfg_str(entry.get("authorization"))),
         "did_configured": bool(_cfg_str(entry.get("did"))),
-        "registration_url": urljoin(base_url.rstrip("/") + "/", reg_path) if reg_path else "",
-        "invite_url": urljoin(base_url.rstrip("/") + "/", inv_path) if inv_path else "",
+        "registration_url": join_url(base_url, reg_path) if reg_path else "",
+        "invite_url": join_url(base_url, inv_path) if inv_path else "",
+    }
+
+
+def _mp_site_item(s: Site, local_entries: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    domain = _normalize_domain(s.domain)
+    entry = local_entries.get(domain) or {}
+
+    effective_name = _cfg_str(entry.get("name")) or s.name
+    raw_template = (_cfg_str(entry.get("template")) or "").lower()
+    if raw_template in _VALID_TEMPLATES:
+        template = raw_template
+    elif domain.endswith("m-team.cc"):
+        template = "mteam"
+    else:
+        template = "nexusphp"
+
+    view = _site_entry_view(entry, s.url)
+    reg_default, inv_default = TEMPLATE_DEFAULT_PATHS.get(template, TEMPLATE_DEFAULT_PATHS["nexusphp"])
+    return {
+        "domain": domain,
+        "name": effective_name,
+        "url": s.url,
+        "source": "moviepilot",
+        "template": template,
+        "has_local_config": bool(entry),
+        "cookie_configured": bool(view.get("cookie_configured")),
+        "authorization_configured": bool(view.get("authorization_configured")),
+        "did_configured": bool(view.get("did_configured")),
+        "registration_url": view.get("registration_url") or join_url(s.url, reg_default),
+        "invite_url": view.get("invite_url") or join_url(s.url, inv_default),
+    }
+
+
+def _manual_site_item(dom: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    url = _cfg_str(entry.get("url"))
+    if not url:
+        return None
+    name = _cfg_str(entry.get("name")) or dom
+    template = (_cfg_str(entry.get("template")) or "custom").lower()
+    if template not in _VALID_TEMPLATES:
+        template = "mteam" if dom.endswith("m-team.cc") else "custom"
+    view = _site_entry_view(entry, url)
+    # Custom sites have no well-known pages; their links come from the configured paths only.
+    reg_default, inv_default = TEMPLATE_DEFAULT_PATHS.get(template, ("", ""))
+    return {
+        "domain": dom,
+        "name": name,
+        "url": url,
+        "source": "manual",
+        "template": template,
+        "has_local_config": True,
+        "cookie_configured": bool(view.get("cookie_configured")),
+        "authorization_configured": bool(view.get("authorization_configured")),
+        "did_configured": bool(view.get("did_configured")),
+        "registration_url": view.get("registration_url") or (join_url(url, reg_default) if reg_default else ""),
+        "invite_url": view.get("invite_url") or (join_url(url, inv_default) if inv_default else ""),
     }
 
 
+def _site_item_sort_key(item: Dict[str, Any]) -> tuple[bool, bool, str]:
+    # Items are built in api_sites_get, so source/name/domain are always present; only the
+    # extras-derived reachability_state can be missing.
+    return (
+        item.get("reachability_state") == "down",
+        item["source"] != "moviepilot",
+        item["name"] or item["domain"],
+    )
+
+
 async def get_ctx() -> AppContext:
     ctx: Optional[AppContext] = getattr(app.state, "ctx", None)
     if ctx is None:
@@ -254,28 +487,43 @@ async def get_ctx() -> AppContext:
     return ctx
 
 
-def _maybe_require_auth(
-    request: Request,
-    credentials: Optional[HTTPBasicCredentials],
-    settings: Settings,
-) -> None:
-    if not settings.web.basic_auth.enabled:
+async def get_app_config(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
+    return await _load_app_config(ctx)
+
+
+async def get_sites_config(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
+    return await _load_sites_config(ctx)
+
+
+def _auth_state(settings: Settings) -> tuple[bool, bytes, bytes]:
+    auth = settings.web.basic_auth
+    return auth.enabled, auth.username.encode("utf-8"), auth.password.encode("utf-8")
+
+
+async def require_auth(request: Request) -> None:
+    state = getattr(request.app.state, "auth", None)
+    if state is None:
+        raise HTTPException(status_code=503, detail="App not ready")
+    enabled, username_b, password_b = state
+    if not enabled:
+        # Auth off (the usual self-hosted setup): don't even parse the Authorization header.
         return
+    credentials: Optional[HTTPBasicCredentials] = await basic_security(request)
     if not credentials or not credentials.username or not credentials.password:
         raise HTTPException(status_code=401, headers={"WWW-Authenticate": "Basic"})
-    if credentials.username != settings.web.basic_auth.username or credentials.password != settings.web.basic_auth.password:
+    # Compare both fields in constant time; `&` (not `and`) so neither result short-circuits.
+    user_ok = hmac.compare_digest(credentials.username.encode("utf-8"), username_b)
+    pass_ok = hmac.compare_digest(credentials.password.encode("utf-8"), password_b)
+    if not (user_ok & pass_ok):
         raise HTTPException(status_code=401, detail="Unauthorized", headers={"WWW-Authenticate": "Basic"})
 
 
-async def require_auth(
-    request: Request,
-    credentials: Annotated[Optional[HTTPBasicCredentials], Depends(basic_security)],
-    ctx: Annotated[AppContext, Depends(get_ctx)],
-) -> None:
-    _maybe_require_auth(request, credentials, ctx.settings)
+# Startup/Shutdown handlers removed (replaced by lifespan)
 
 
-# Startup/Shutdown handlers removed (replaced by lifespan)
+# Everything under /api except /api/version sits behind Basic auth; the router applies it once for all of them.
+api_router = APIRouter(prefix="/api", dependencies=[Depends(require_auth)])
+spa_router = APIRouter(dependencies=[Depends(require_auth)], default_response_class=HTMLResponse)
 
 
 @app.get("/health")
@@ -288,160 +536,50 @@ async def api_version(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str,
     return {"version": __version__}
 
 
-@app.get("/api/dashboard", dependencies=[Depends(require_auth)])
+@api_router.get("/dashboard")
 async def api_dashboard(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
-    now = datetime.now(timezone.utc)
-
-    cfg = await _load_app_config(ctx)
-    mp_cfg = _safe_dict(cfg.get("moviepilot"))
-    ui_cfg = _safe_dict(cfg.get("ui"))
-    mp_base_url = _cfg_str(mp_cfg.get("base_url")) or ctx.settings.moviepilot.base_url
-    mp_sites_cache_ttl = _cfg_int(
-        mp_cfg.get("sites_cache_ttl_seconds"),
-        MP_SITES_CACHE_DEFAULT_TTL_SECONDS,
-        MP_SITES_CACHE_MIN_TTL_SECONDS,
-        MP_SITES_CACHE_MAX_TTL_SECONDS,
-    )
-
-    mp_sites = []
-    try:
-        cache = parse_cache(await ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
-        if cache and not cache_expired(cache, now, mp_sites_cache_ttl, base_url=mp_base_url):
-            mp_sites = cache.sites
-    except Exception:
-        mp_sites = []
-    if not mp_sites:
-        try:
-            snap_at, snap_sites = await ctx.store.load_sites_snapshot()
-            if snap_sites and snap_at and int((now - snap_at).total_seconds()) <= mp_sites_cache_ttl:
-                mp_sites = snap_sites
-        except Exception:
-            mp_sites = []
-
-    sites_cfg = await _load_sites_config(ctx)
-    sites = ctx.scanner._merge_sites(mp_sites, _safe_dict(sites_cfg.get("entries")))
-    current_domains = [_normalize_domain(s.domain) for s in sites if _normalize_domain(s.domain)]
-
-    states = await ctx.store.list_site_states()
-    state_map = {_normalize_domain(r.get("domain") or ""): r for r in states if _normalize_domain(r.get("domain") or "")}
-
-    extras_map: Dict[str, Dict[str, Any]] = {}
-    try:
-        extras_map = await ctx.store.get_sites_extras(current_domains)
-    except Exception:
-        extras_map = {}
-
-    def _infer_engine(domain: str, template: str) -> str:
-        t = (template or "").strip().lower()
-        if not t:
-            if domain.endswith("m-team.cc"):
-                return "mteam"
-            return "nexusphp"
-        return t
-
-    def _default_paths_for_template(template: str) -> tuple[str, str]:
-        t = (template or "").strip().lower()
-        if t == "mteam":
-            return "signup", "invite"
-        return "signup.php", "invite.php"
-
-    rows: list[dict[str, Any]] = []
-    for site in sites:
-        domain = _normalize_domain(site.domain)
-        if not domain:
-            continue
-        row = dict(state_map.get(domain) or {})
-
-        template = _cfg_str(getattr(site, "template", None)).lower()
-        engine = _cfg_str(row.get("engine")) or _infer_engine(domain, template)
-        row["domain"] = domain
-        row["name"] = _cfg_str(getattr(site, "name", None)) or row.get("name") or domain
-        row["url"] = _cfg_str(getattr(site, "url", None)) or row.get("url") or ""
-        row["engine"] = engine
-
-        if "reachability_state" not in row:
-            row["reachability_state"] = "unknown"
-        if "reachability_note" not in row:
-            row["reachability_note"] = ""
-        if "registration_state" not in row:
-            row["registration_state"] = "unknown"
-        if "registration_note" not in row:
-            row["registration_note"] = ""
-        if "invites_state" not in row:
-            row["invites_state"] = "unknown"
-        if "invites_available" not in row:
-            row["invites_available"] = None
-        if "invites_display" not in row:
-            row["invites_display"] = ""
-        if "last_checked_at" not in row:
-            row["last_checked_at"] = ""
-        if "last_changed_at" not in row:
-            row["last_changed_at"] = None
-        if "errors" not in row:
-            row["errors"] = []
-
-        base_url = row["url"]
-        reg_default, inv_default = _default_paths_for_template(template)
-        reg_path = _cfg_str(getattr(site, "registration_path", None)) or (reg_default if template in {"", "nexusphp", "mteam"} else "")
-        inv_path = _cfg_str(getattr(site, "invite_path", None)) or (inv_default if template in {"", "nexusphp", "mteam"} else "")
-
-        invite_uid = _cfg_str((extras_map.get(domain) or {}).get("invite_uid")) if template in {"", "nexusphp"} else ""
-        if invite_uid:
-            inv_path = f"invite.php?id={invite_uid}"
-
-        row["registration_url"] = urljoin(base_url.rstrip("/") + "/", reg_path) if base_url and reg_path else ""
-        row["invite_url"] = urljoin(base_url.rstrip("/") + "/", inv_path) if base_url and inv_path else ""
-
-        rows.append(row)
+    # The merged rows are precomputed by the scanner; only the live scanning flags are per-request.
+    view = await ctx.scanner.dashboard_view()
 
     inflight = set()
     try:
         inflight = set(getattr(ctx.scanner, "in_flight_domains")() or [])
     except Exception:
         inflight = set()
-    if inflight:
-        for r in rows:
-            r["scanning"] = _normalize_domain(r.get("domain") or "") in inflight
-    else:
-        for r in rows:
-            r["scanning"] = False
-    scan_status = await ctx.store.get_json("scan_status", default=None)
-    scan_hint = await ctx.store.get_json(_SCAN_HINT_KEY, default=None)
-    ui = {"allow_state_reset": _cfg_bool(ui_cfg.get("allow_state_reset"), default=True)}
-    return {"rows": rows, "scan_status": scan_status, "scan_hint": scan_hint, "ui": ui}
+    rows = [{**r, "scanning": r["domain"] in inflight} for r in view["rows"]]
+    return {**view, "rows": rows}
 
 
-@app.post("/api/scan/run", dependencies=[Depends(require_auth)])
+@api_router.post("/scan/run")
 async def api_scan_run(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     status = await ctx.scanner.run_once()
-    await ws_broadcaster.broadcast({"type": "dashboard_update"})
-    await ws_broadcaster.broadcast({"type": "logs_update"})
+    _restart_scan_interval()
+    await ws_broadcaster.broadcast_many(["dashboard", "logs"])
     return status
 
 
-@app.post("/api/scan/manual", dependencies=[Depends(require_auth)])
+@api_router.post("/scan/manual")
 async def api_scan_manual(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     try:
         status = await ctx.scanner.run_once(force=True)
-        await ws_broadcaster.broadcast({"type": "dashboard_update"})
-        await ws_broadcaster.broadcast({"type": "logs_update"})
+        _restart_scan_interval()
+        await ws_broadcaster.broadcast_many(["dashboard", "logs"])
         return status
     except AlreadyScanningError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
 
-@app.post("/api/scan/run/{domain}", dependencies=[Depends(require_auth)])
+@api_router.post("/scan/run/{domain}")
 async def api_scan_run_one(domain: str, ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     try:
         status = await ctx.scanner.run_one(domain)
-        await ws_broadcaster.broadcast({"type": "dashboard_update"})
-        await ws_broadcaster.broadcast({"type": "logs_update"})
+        await ws_broadcaster.broadcast_many(["dashboard", "logs"])
         return status
     except AlreadyScanningError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
 
-@app.post("/api/state/reset", dependencies=[Depends(require_auth)])
+@api_router.post("/state/reset")
 async def api_state_reset(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     cfg = await _load_app_config(ctx)
     ui_cfg = _safe_dict(cfg.get("ui"))
@@ -450,18 +588,16 @@ async def api_state_reset(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[
         raise HTTPException(status_code=403, detail="state reset disabled")
 
     await ctx.store.reset_site_states()
-    await ctx.store.set_json("scan_status", None)
-    await ctx.store.set_json(_SCAN_HINT_KEY, None)
-    try:
-        await ctx.store.add_event(category="config", level="info", action="state_reset", message="site state reset")
-    except Exception:
-        pass
-    await ws_broadcaster.broadcast({"type": "dashboard_update"})
-    await ws_broadcaster.broadcast({"type": "logs_update"})
+    await asyncio.gather(
+        ctx.store.set_json("scan_status", None),
+        ctx.store.set_json(_SCAN_HINT_KEY, None),
+        _add_event_quietly(ctx, category="config", level="info", action="state_reset", message="site state reset"),
+    )
+    await ws_broadcaster.broadcast_many(["dashboard", "logs"])
     return {"ok": True}
 
 
-@app.get("/api/logs", dependencies=[Depends(require_auth)])
+@api_router.get("/logs")
 async def api_logs(
     ctx: Annotated[AppContext, Depends(get_ctx)],
     category: str = "all",
@@ -473,7 +609,7 @@ async def api_logs(
     return {"items": items}
 
 
-@app.get("/api/logs/domains", dependencies=[Depends(require_auth)])
+@api_router.get("/logs/domains")
 async def api_logs_domains(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     domains = await ctx.store.get_log_domains()
     return {"domains": domains}
@@ -483,17 +619,20 @@ async def api_logs_domains(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict
 async def websocket_endpoint(websocket: WebSocket):
     await ws_broadcaster.connect(websocket)
     try:
-        await websocket.send_json({"type": "connected"})
-        while True:
-            await websocket.receive_text()  # Keep alive / receive pings
+        await websocket.send_text(_WS_CONNECTED_FRAME)
+        # Protocol-level keepalive is handled by the server (uvicorn ws_ping_interval); the
+        # client's "ping" text frames are just drained. iter_text() ends cleanly on disconnect.
+        async for _ in websocket.iter_text():
+            pass
     except WebSocketDisconnect:
+        pass
+    finally:
         ws_broadcaster.disconnect(websocket)
 
 
-@app.get("/api/config", dependencies=[Depends(require_auth)])
+@api_router.get("/config")
 async def api_config_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
-    cfg = await ctx.store.get_json("app_config", default={})
-    cfg = _safe_dict(cfg)
+    cfg = await _load_app_config(ctx)
     mp_cfg = _safe_dict(cfg.get("moviepilot"))
     connectivity_cfg = _safe_dict(cfg.get("connectivity"))
     cookie_cfg = _safe_dict(cfg.get("cookie"))
@@ -514,7 +653,7 @@ async def api_config_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[s
         ),
     }
     cookie = {
-        "source": (_cfg_str(cookie_cfg.get("source")) if isinstance(cookie_cfg, dict) else "") or ctx.settings.cookie.source,
+        "source": _cfg_str(cookie_cfg.get("source")) or ctx.settings.cookie.source,
         "cookiecloud": {
             "base_url": _cfg_str(cc_cfg.get("base_url")) or ctx.settings.cookie.cookiecloud.base_url,
             "uuid": _cfg_str(cc_cfg.get("uuid")) or ctx.settings.cookie.cookiecloud.uuid,
@@ -570,13 +709,13 @@ async def api_config_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[s
     return {"moviepilot": moviepilot, "connectivity": connectivity, "cookie": cookie, "scan": scan, "ui": ui}
 
 
-@app.put("/api/config", dependencies=[Depends(require_auth)])
+@api_router.put("/config")
 async def api_config_put(
     ctx: Annotated[AppContext, Depends(get_ctx)],
     payload: Dict[str, Any] = Body(default={}),
 ) -> Dict[str, Any]:
-    cfg = await ctx.store.get_json("app_config", default={}) or {}
-    cfg = _safe_dict(cfg)
+    # Start from a private copy of the cached config (nested sections are edited in place below).
+    cfg = _json_clone(await _load_app_config(ctx))
 
     payload = _safe_dict(payload)
 
@@ -628,7 +767,7 @@ async def api_config_put(
 
     cookie = _safe_dict(cfg.get("cookie"))
     src = _cfg_str(cookie_in.get("source")).lower()
-    if src in {"auto", "cookiecloud", "moviepilot"}:
+    if src in _VALID_COOKIE_SOURCES:
         cookie["source"] = src
 
     cc = _safe_dict(cookie.get("cookiecloud"))
@@ -648,6 +787,7 @@ async def api_config_put(
 
     scan = _safe_dict(cfg.get("scan"))
     scan_interval_default = int(scan.get("interval_seconds") or ctx.settings.scan.interval_seconds)
+    prev_scan_interval = scan.get("interval_seconds")
     scan_timeout_default = int(scan.get("timeout_seconds") or ctx.settings.scan.timeout_seconds)
     scan_concurrency_default = int(scan.get("concurrency") or ctx.settings.scan.concurrency)
     scan["interval_seconds"] = _cfg_int(scan_in.get("interval_seconds"), scan_interval_default, 30, 24 * 3600)
@@ -672,39 +812,53 @@ async def api_config_put(
         ui["allow_state_reset"] = _cfg_bool(ui_in.get("allow_state_reset"), default=True)
     cfg["ui"] = ui
 
-    await ctx.store.set_json("app_config", cfg)
-    try:
-        await ctx.store.add_event(
+    await asyncio.gather(
+        ctx.store.set_json("app_config", cfg),
+        _add_event_quietly(
+            ctx,
             category="config",
             level="info",
             action="config_update",
             message="app config updated",
             detail={"keys": list(payload.keys())},
-        )
-    except Exception:
-        pass
+        ),
+    )
+    if scan["interval_seconds"] != prev_scan_interval:
+        _wake_scan_loop()
     return {"ok": True}
 
 
-@app.post("/api/config/reset", dependencies=[Depends(require_auth)])
+@api_router.post("/config/reset")
 async def api_config_reset(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     await ctx.store.set_json("app_config", {})
+    _wake_scan_loop()
     try:
         await ctx.store.add_event(category="config", level="info", action="config_reset", message="app config reset")
     except Exception:
         pass
     return {"ok": True}
 
-def _deep_merge(base: Any, update: Any) -> Any:
-    if not isinstance(base, dict) or not isinstance(update, dict):
-        return update
-    merged = dict(base)
-    for k, v in update.items():
-        if k in merged:
-            merged[k] = _deep_merge(merged[k], v)
-        else:
-            merged[k] = v
-    return merged
+def _deep_merge(dst: Any, src: Any) -> Any:
+    # Merges `src` into `dst` in place and returns `dst`; callers pass a `dst` they own (fresh
+    # from get_json). Values come from JSON, so exact `dict` class checks are sufficient.
+    if dst.__class__ is not dict or src.__class__ is not dict:
+        return src
+    stack = [(dst, src)]
+    while stack:
+        target, update = stack.pop()
+        for k, v in update.items():
+            current = target.get(k)
+            if current.__class__ is dict and v.__class__ is dict:
+                if v:
+                    stack.append((current, v))
+            else:
+                target[k] = v
+    return dst
+
+
+def _json_clone(value: Dict[str, Any]) -> Dict[str, Any]:
+    # Config and backup sections come straight from the kv store, so they are plain JSON data.
+    return orjson.loads(orjson.dumps(value))
 
 
 def _redact_backup(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -712,7 +866,7 @@ def _redact_backup(data: Dict[str, Any]) -> Dict[str, Any]:
     notif = _safe_dict(data.get("notifications"))
     sites = _safe_dict(data.get("sites"))
 
-    cfg = _deep_merge({}, cfg)
+    cfg = _json_clone(cfg)
     mp = _safe_dict(cfg.get("moviepilot"))
     mp.pop("password", None)
     mp.pop("otp_password", None)
@@ -726,7 +880,7 @@ def _redact_backup(data: Dict[str, Any]) -> Dict[str, Any]:
     if cookie:
         cfg["cookie"] = cookie
 
-    notif = _deep_merge({}, notif)
+    notif = _json_clone(notif)
     telegram = _safe_dict(notif.get("telegram"))
     telegram.pop("token", None)
     if telegram:
@@ -736,7 +890,7 @@ def _redact_backup(data: Dict[str, Any]) -> Dict[str, Any]:
     if wecom:
         notif["wecom"] = wecom
 
-    sites = _deep_merge({}, sites)
+    sites = _json_clone(sites)
     entries = _safe_dict(sites.get("entries"))
     redacted_entries: Dict[str, Any] = {}
     for domain, entry_any in entries.items():
@@ -750,17 +904,20 @@ def _redact_backup(data: Dict[str, Any]) -> Dict[str, Any]:
     return {"app_config": cfg, "notifications": notif, "sites": sites}
 
 
-@app.get("/api/backup/export", dependencies=[Depends(require_auth)])
+@api_router.get("/backup/export")
 async def api_backup_export(
     ctx: Annotated[AppContext, Depends(get_ctx)],
     include_secrets: int = 1,
 ) -> Dict[str, Any]:
     include = bool(int(include_secrets or 0))
-    app_cfg = await ctx.store.get_json("app_config", default={}) or {}
-    notif_cfg = await ctx.store.get_json("notifications", default={}) or {}
-    sites_cfg = await ctx.store.get_json("sites", default={"version": 1, "entries": {}}) or {"version": 1, "entries": {}}
+    app_cfg, notif_cfg, sites_cfg = await asyncio.gather(
+        _load_app_config(ctx),
+        _load_notifications_config(ctx),
+        ctx.store.get_json("sites", default={"version": 1, "entries": {}}),
+    )
+    sites_cfg = sites_cfg or {"version": 1, "entries": {}}
 
-    data = {"app_config": _safe_dict(app_cfg), "notifications": _safe_dict(notif_cfg), "sites": _safe_dict(sites_cfg)}
+    data = {"app_config": app_cfg, "notifications": notif_cfg, "sites": _safe_dict(sites_cfg)}
     if not include:
         data = _redact_backup(data)
 
@@ -783,51 +940,51 @@ async def api_backup_export(
     }
 
 
-@app.post("/api/backup/import", dependencies=[Depends(require_auth)])
+@api_router.post("/backup/import")
 async def api_backup_import(
     ctx: Annotated[AppContext, Depends(get_ctx)],
     payload: Dict[str, Any] = Body(default={}),
     mode: str = "merge",
 ) -> Dict[str, Any]:
     mode = (mode or "").strip().lower()
-    if mode not in {"merge", "replace"}:
+    if mode not in _BACKUP_IMPORT_MODES:
         raise HTTPException(status_code=400, detail="mode must be merge|replace")
 
     root = _safe_dict(payload)
     data = _safe_dict(root.get("data")) or root
 
-    changed: list[str] = []
+    changed: list[str] = [k for k in ("app_config", "notifications", "sites") if k in data]
+
+    # Merge mode needs the current values; read them together, then write all sections together.
+    current: Dict[str, Any] = {}
+    if mode == "merge" and changed:
+        values = await asyncio.gather(
+            *(ctx.store.get_json(k, default={"version": 1, "entries": {}} if k == "sites" else {}) for k in changed)
+        )
+        current = {k: _safe_dict(v) for k, v in zip(changed, values)}
 
+    writes: Dict[str, Any] = {}
     if "app_config" in data:
         incoming = _safe_dict(data.get("app_config"))
-        if mode == "replace":
-            await ctx.store.set_json("app_config", incoming)
-        else:
-            current = await ctx.store.get_json("app_config", default={}) or {}
-            await ctx.store.set_json("app_config", _deep_merge(_safe_dict(current), incoming))
-        changed.append("app_config")
+        writes["app_config"] = incoming if mode == "replace" else _deep_merge(current["app_config"], incoming)
 
     if "notifications" in data:
         incoming = _safe_dict(data.get("notifications"))
-        if mode == "replace":
-            await ctx.store.set_json("notifications", incoming)
-        else:
-            current = await ctx.store.get_json("notifications", default={}) or {}
-            await ctx.store.set_json("notifications", _deep_merge(_safe_dict(current), incoming))
-        changed.append("notifications")
+        writes["notifications"] = incoming if mode == "replace" else _deep_merge(current["notifications"], incoming)
 
     if "sites" in data:
         incoming_sites = _safe_dict(data.get("sites"))
         incoming_entries = _safe_dict(incoming_sites.get("entries"))
-        incoming = {"version": int(incoming_sites.get("version") or 1), "entries": incoming_entries}
         if mode == "replace":
-            await ctx.store.set_json("sites", incoming)
+            writes["sites"] = {"version": int(incoming_sites.get("version") or 1), "entries": incoming_entries}
         else:
-            current = await ctx.store.get_json("sites", default={"version": 1, "entries": {}}) or {"version": 1, "entries": {}}
-            current_entries = _safe_dict(_safe_dict(current).get("entries"))
-            merged_entries = _deep_merge(current_entries, incoming_entries)
-            await ctx.store.set_json("sites", {"version": 1, "entries": merged_entries})
-        changed.append("sites")
+            current_entries = _safe_dict(current["sites"].get("entries"))
+            writes["sites"] = {"version": 1, "entries": _deep_merge(current_entries, incoming_entries)}
+
+    if writes:
+        await asyncio.gather(*(ctx.store.set_json(k, v) for k, v in writes.items()))
+        if "app_config" in writes:
+            _wake_scan_loop()
 
     if not changed:
         raise HTTPException(status_code=400, detail="no supported keys found in payload")
@@ -856,10 +1013,9 @@ async def api_backup_import(
     return {"ok": True, "message": f"imported: {', '.join(changed)}", "changed": list(changed), "needs_scan": needs_scan_hint}
 
 
-@app.get("/api/notifications", dependencies=[Depends(require_auth)])
+@api_router.get("/notifications")
 async def api_notifications_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
-    cfg = await ctx.store.get_json("notifications", default={}) or {}
-    cfg = _safe_dict(cfg)
+    cfg = await _load_notifications_config(ctx)
     telegram = _safe_dict(cfg.get("telegram"))
     wecom = _safe_dict(cfg.get("wecom"))
 
@@ -881,41 +1037,28 @@ async def api_notifications_get(ctx: Annotated[AppContext, Depends(get_ctx)]) ->
     return {"telegram": telegram_view, "wecom": wecom_view}
 
 
-@app.put("/api/notifications", dependencies=[Depends(require_auth)])
+@api_router.put("/notifications")
 async def api_notifications_put(
     ctx: Annotated[AppContext, Depends(get_ctx)],
     payload: Dict[str, Any] = Body(default={}),
 ) -> Dict[str, Any]:
-    cfg = await ctx.store.get_json("notifications", default={}) or {}
-    cfg = _safe_dict(cfg)
+    cfg = await _load_notifications_config(ctx)
 
     payload = _safe_dict(payload)
     tg_in = _safe_dict(payload.get("telegram"))
     wc_in = _safe_dict(payload.get("wecom"))
 
-    telegram = _safe_dict(cfg.get("telegram"))
-    wecom = _safe_dict(cfg.get("wecom"))
+    # Copies, so the stored cfg stays intact for the unchanged check below.
+    telegram = dict(_safe_dict(cfg.get("telegram")))
+    wecom = dict(_safe_dict(cfg.get("wecom")))
 
     if "enabled" in tg_in:
         telegram["enabled"] = bool(tg_in.get("enabled"))
-    token = _cfg_str(tg_in.get("token"))
-    if token:
-        telegram["token"] = token
-    chat_id = _cfg_str(tg_in.get("chat_id"))
-    if chat_id:
-        telegram["chat_id"] = chat_id
+    _apply_str_fields(tg_in, telegram, "token", "chat_id")
 
     if "enabled" in wc_in:
         wecom["enabled"] = bool(wc_in.get("enabled"))
-    corpid = _cfg_str(wc_in.get("corpid"))
-    if corpid:
-        wecom["corpid"] = corpid
-    app_secret = _cfg_str(wc_in.get("app_secret"))
-    if app_secret:
-        wecom["app_secret"] = app_secret
-    agent_id = _cfg_str(wc_in.get("agent_id"))
-    if agent_id:
-        wecom["agent_id"] = agent_id
+    _apply_str_fields(wc_in, wecom, "corpid", "app_secret", "agent_id")
 
     if "to_user" in wc_in:
         wecom["to_user"] = (_cfg_str(wc_in.get("to_user")) or "@all").strip()
@@ -924,7 +1067,12 @@ async def api_notifications_put(
     if "to_tag" in wc_in:
         wecom["to_tag"] = _cfg_str(wc_in.get("to_tag"))
 
-    await ctx.store.set_json("notifications", {"telegram": telegram, "wecom": wecom})
+    updated = {"telegram": telegram, "wecom": wecom}
+    if updated == cfg:
+        # The UI resubmits the whole form; nothing to write or log when it didn't change.
+        return {"ok": True, "unchanged": True}
+
+    await ctx.store.set_json("notifications", updated)
     try:
         await ctx.store.add_event(
             category="notify",
@@ -943,7 +1091,7 @@ async def api_notifications_put(
     return {"ok": True}
 
 
-@app.post("/api/notifications/test/{channel}", dependencies=[Depends(require_auth)])
+@api_router.post("/notifications/test/{channel}")
 async def api_notifications_test(channel: str, ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
     if channel not in {"telegram", "wecom"}:
         raise HTTPException(status_code=404, detail="unknown channel")
@@ -961,9 +1109,12 @@ async def api_notifications_test(channel: str, ctx: Annotated[AppContext, Depend
     return {"ok": bool(ok), "message": str(msg or "")}
 
 
-@app.get("/api/sites", dependencies=[Depends(require_auth)])
-async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
-    app_cfg = await _load_app_config(ctx)
+@api_router.get("/sites")
+async def api_sites_get(
+    ctx: Annotated[AppContext, Depends(get_ctx)],
+    app_cfg: Annotated[Dict[str, Any], Depends(get_app_config)],
+    sites_cfg: Annotated[Dict[str, Any], Depends(get_sites_config)],
+) -> Dict[str, Any]:
     mp_cfg = _safe_dict(app_cfg.get("moviepilot"))
     connectivity_cfg = _safe_dict(app_cfg.get("connectivity"))
     scan_cfg = _safe_dict(app_cfg.get("scan"))
@@ -1012,6 +1163,9 @@ async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[st
         mp_fp = fingerprint_moviepilot(mp_base_url)
         mp_dep = get_dep_status(deps_status, "moviepilot")
         mp_allowed = can_attempt(mp_dep, now, mp_fp)
+        # Only needed as a fallback, but issuing it now overlaps the local read with the MP round-trip.
+        cache_read = asyncio.ensure_future(ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
+        cache_payload: Any = None
         if not mp_allowed:
             mp_error = mp_dep.error
         else:
@@ -1027,19 +1181,14 @@ async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[st
                 mp_sites = await mp_client.list_sites(only_active=True)
                 mp_ok = True
                 mp_source = "live"
-                mp_cache_fetched_at = now.isoformat()
+                cache_payload = build_cache(mp_base_url, mp_sites, fetched_at=now)
+                mp_cache_fetched_at = cache_payload["fetched_at"]
                 mp_cache_age_seconds = 0
                 mp_cache_expired = False
-                try:
-                    await ctx.store.set_json(MP_SITES_CACHE_KEY, build_cache(mp_base_url, mp_sites, fetched_at=now))
-                except Exception:
-                    logger.exception("failed to persist MoviePilot sites cache")
+                _persist_json_later(ctx, MP_SITES_CACHE_KEY, cache_payload)
 
                 deps_status = update_dep_ok(deps_status, "moviepilot", now, mp_fp)
-                try:
-                    await ctx.store.set_json(DEPS_STATUS_KEY, deps_status)
-                except Exception:
-                    logger.exception("failed to persist deps status")
+                _persist_json_later(ctx, DEPS_STATUS_KEY, deps_status)
             except Exception as e:
                 mp_error = _format_error_detail(e)
                 deps_status = update_dep_fail(
@@ -1050,16 +1199,22 @@ async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[st
                     mp_error,
                     retry_interval_seconds=deps_retry_interval,
                 )
-                try:
-                    await ctx.store.set_json(DEPS_STATUS_KEY, deps_status)
-                except Exception:
-                    logger.exception("failed to persist deps status")
+                _persist_json_later(ctx, DEPS_STATUS_KEY, deps_status)
+
+        try:
+            stored_payload = await cache_read
+        except Exception:
+            stored_payload = None
+            if not mp_sites:
+                logger.exception("failed to load MoviePilot sites cache")
+        if cache_payload is None:
+            cache_payload = stored_payload
 
         if mp_sites:
             pass
         else:
             try:
-                cache = parse_cache(await ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
+                cache = parse_cache(cache_payload)
                 if cache:
                     mp_cache_fetched_at = cache.fetched_at_iso
                     mp_cache_age_seconds = cache.age_seconds(now)
@@ -1080,123 +1235,51 @@ async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[st
                             mp_cache_expired = False
                             mp_sites = snap_sites
                             mp_source = "state"
-                            try:
-                                await ctx.store.set_json(MP_SITES_CACHE_KEY, build_cache(mp_base_url, mp_sites, fetched_at=snap_at))
-                            except Exception:
-                                logger.exception("failed to persist MoviePilot sites cache (seeded)")
+                            _persist_json_later(ctx, MP_SITES_CACHE_KEY, build_cache(mp_base_url, mp_sites, fetched_at=snap_at))
                         else:
                             mp_cache_expired = True
                 except Exception:
                     logger.exception("failed to load sites snapshot from local state")
 
-    sites_cfg = await _load_sites_config(ctx)
-    entries = _safe_dict(sites_cfg.get("entries"))
-
-    items: list[Dict[str, Any]] = []
-    mp_domains = set()
-    for s in mp_sites:
-        domain = _normalize_domain(s.domain)
-        mp_domains.add(domain)
-        entry = _safe_dict(entries.get(domain))
-        if entry and (_cfg_str(entry.get("mode")) or "").lower() not in {"override", "manual"}:
-            entry = {}
-
-        effective_name = _cfg_str(entry.get("name")) or s.name
-        raw_template = (_cfg_str(entry.get("template")) or "").lower()
-        if raw_template in {"nexusphp", "custom", "mteam"}:
-            template = raw_template
-        elif domain.endswith("m-team.cc"):
-            template = "mteam"
-        else:
-            template = "nexusphp"
-
-        view = _site_entry_view(entry, s.url)
-        if template == "mteam":
-            reg_default = "signup"
-            inv_default = "invite"
-        else:
-            reg_default = "signup.php"
-            inv_default = "invite.php"
-        items.append(
-            {
-                "domain": domain,
-                "name": effective_name,
-                "url": s.url,
-                "source": "moviepilot",
-                "template": template,
-                "has_local_config": bool(entry),
-                "cookie_configured": bool(view.get("cookie_configured")),
-                "authorization_configured": bool(view.get("authorization_configured")),
-                "did_configured": bool(view.get("did_configured")),
-                "registration_url": view.get("registration_url") or urljoin(s.url.rstrip("/") + "/", reg_default),
-                "invite_url": view.get("invite_url") or urljoin(s.url.rstrip("/") + "/", inv_default),
-            }
-        )
-
-    # Manual sites
-    for domain, raw in entries.items():
-        dom = _normalize_domain(domain)
-        entry = _safe_dict(raw)
-        mode = (_cfg_str(entry.get("mode")) or "manual").lower()
-        if mode != "manual":
-            continue
-        if dom in mp_domains:
-            # If it collides with MP domain, treat it as an override record.
-            continue
-
-        url = _cfg_str(entry.get("url"))
-        if not url:
+    # Index local entries once: records that can decorate an MP site, and manual sites to emit afterwards.
+    local_entries: Dict[str, Dict[str, Any]] = {}
+    manual_entries: list[tuple[str, Dict[str, Any]]] = []
+    for key, raw in _safe_dict(sites_cfg.get("entries")).items():
+        if raw.__class__ is not dict:
             continue
-        name = _cfg_str(entry.get("name")) or dom
-        template = (_cfg_str(entry.get("template")) or "custom").lower()
-        if template not in {"nexusphp", "custom", "mteam"}:
-            template = "mteam" if dom.endswith("m-team.cc") else "custom"
-        view = _site_entry_view(entry, url)
-        if template == "mteam":
-            reg_default = "signup"
-            inv_default = "invite"
-        else:
-            reg_default = "signup.php"
-            inv_default = "invite.php"
-        items.append(
-            {
-                "domain": dom,
-                "name": name,
-                "url": url,
-                "source": "manual",
-                "template": template,
-                "has_local_config": True,
-                "cookie_configured": bool(view.get("cookie_configured")),
-                "authorization_configured": bool(view.get("authorization_configured")),
-                "did_configured": bool(view.get("did_configured")),
-                "registration_url": view.get("registration_url")
-                or (urljoin(url.rstrip("/") + "/", reg_default) if template in {"nexusphp", "mteam"} else ""),
-                "invite_url": view.get("invite_url") or (urljoin(url.rstrip("/") + "/", inv_default) if template in {"nexusphp", "mteam"} else ""),
-            }
-        )
+        dom = _normalize_domain(key)
+        mode = _cfg_str(raw.get("mode")).lower()
+        if mode in {"override", "manual"}:
+            local_entries[dom] = raw
+        if (mode or "manual") == "manual":
+            manual_entries.append((dom, raw))
+
+    items = [_mp_site_item(site, local_entries) for site in mp_sites]
+    mp_domains = {x["domain"] for x in items}
+    # Manual sites; one that collides with an MP domain is treated as an override record instead.
+    items.extend(
+        item
+        for dom, entry in manual_entries
+        if dom not in mp_domains and (item := _manual_site_item(dom, entry)) is not None
+    )
 
     try:
-        extras_map = await ctx.store.get_sites_extras([_normalize_domain(x.get("domain") or "") for x in items])
+        # Item domains are already normalized by _mp_site_item/_manual_site_item.
+        extras_map = await ctx.store.get_sites_extras([x["domain"] for x in items])
         for x in items:
-            dom = _normalize_domain(x.get("domain") or "")
+            dom = x["domain"]
             if not dom:
                 continue
             extra = extras_map.get(dom) or {}
             x["reachability_state"] = extra.get("reachability_state", "unknown")
-            if x.get("template") == "nexusphp":
+            if x["template"] == "nexusphp":
                 invite_uid = extra.get("invite_uid")
                 if invite_uid:
-                    x["invite_url"] = urljoin(x.get("url", "").rstrip("/") + "/", f"invite.php?id={invite_uid}")
+                    x["invite_url"] = join_url(x["url"], f"invite.php?id={invite_uid}")
     except Exception:
         logger.exception("failed to load site extras for sites list")
 
-    items.sort(
-        key=lambda x: (
-            (x.get("reachability_state") == "down"),
-            (x.get("source") != "moviepilot"),
-            x.get("name") or x.get("domain") or "",
-        )
-    )
+    items.sort(key=_site_item_sort_key)
     if mp_error and mp_source in {"cache", "state"} and mp_cache_age_seconds is not None:
         mp_error = f"{mp_error} (fallback={mp_source} age={mp_cache_age_seconds}s)"
     return {
@@ -1210,9 +1293,11 @@ async def api_sites_get(ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[st
     }
 
 
-@app.put("/api/sites", dependencies=[Depends(require_auth)])
+@api_router.put("/sites")
 async def api_sites_put(
     ctx: Annotated[AppContext, Depends(get_ctx)],
+    app_cfg: Annotated[Dict[str, Any], Depends(get_app_config)],
+    sites_cfg: Annotated[Dict[str, Any], Depends(get_sites_config)],
     payload: Dict[str, Any] = Body(default={}),
 ) -> Dict[str, Any]:
     payload = _safe_dict(payload)
@@ -1227,7 +1312,7 @@ async def api_sites_put(
 
     name = _cfg_str(payload.get("name"))
     template = (_cfg_str(payload.get("template")) or "nexusphp").lower()
-    if template not in {"nexusphp", "custom", "mteam"}:
+    if template not in _VALID_TEMPLATES:
         raise HTTPException(status_code=400, detail="template must be nexusphp|custom|mteam")
     if template == "mteam" and not domain.endswith("m-team.cc"):
         raise HTTPException(status_code=400, detail="mteam template requires domain *.m-team.cc")
@@ -1243,7 +1328,6 @@ async def api_sites_put(
     registration_url = _cfg_str(payload.get("registration_url"))
     invite_url = _cfg_str(payload.get("invite_url"))
 
-    sites_cfg = await _load_sites_config(ctx)
     entries = _safe_dict(sites_cfg.get("entries"))
     existed = domain in entries
     entry = _safe_dict(entries.get(domain))
@@ -1290,8 +1374,7 @@ async def api_sites_put(
         entry.pop("registration_path", None)
         entry.pop("invite_path", None)
         if template == "mteam":
-            entry["registration_path"] = "signup"
-            entry["invite_path"] = "invite"
+            entry["registration_path"], entry["invite_path"] = TEMPLATE_DEFAULT_PATHS["mteam"]
 
     entries[domain] = entry
     await ctx.store.set_json("sites", {"version": 1, "entries": entries})
@@ -1308,59 +1391,18 @@ async def api_sites_put(
     except Exception:
         pass
 
-    # Sync site list summary (and notify) using cached MP sites when available.
-    try:
-        now = datetime.now(timezone.utc)
-        app_cfg = await _load_app_config(ctx)
-        mp_cfg = _safe_dict(app_cfg.get("moviepilot"))
-        mp_base_url = _cfg_str(mp_cfg.get("base_url")) or ctx.settings.moviepilot.base_url
-        mp_sites_cache_ttl = _cfg_int(
-            mp_cfg.get("sites_cache_ttl_seconds"),
-            MP_SITES_CACHE_DEFAULT_TTL_SECONDS,
-            MP_SITES_CACHE_MIN_TTL_SECONDS,
-            MP_SITES_CACHE_MAX_TTL_SECONDS,
-        )
-
-        mp_sites: list[Site] = []
-        cache = parse_cache(await ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
-        if cache and not cache_expired(cache, now, mp_sites_cache_ttl, base_url=mp_base_url):
-            mp_sites = cache.sites
-        if not mp_sites:
-            snap_at, snap_sites = await ctx.store.load_sites_snapshot()
-            if snap_sites and snap_at and int((now - snap_at).total_seconds()) <= mp_sites_cache_ttl:
-                mp_sites = snap_sites
-        if not mp_sites:
-            prev_summary = _safe_dict(await ctx.store.get_json(SITE_LIST_SUMMARY_KEY, default=None))
-            prev_items = _safe_dict(prev_summary.get("items"))
-            for dom, item_any in prev_items.items():
-                item = _safe_dict(item_any)
-                if _cfg_str(item.get("source")) != "moviepilot":
-                    continue
-                url = _cfg_str(item.get("url"))
-                if not url:
-                    continue
-                mp_sites.append(
-                    Site(
-                        id=0,
-                        name=_cfg_str(item.get("name")) or _normalize_domain(dom),
-                        domain=_normalize_domain(dom),
-                        url=url,
-                        ua=None,
-                        cookie=None,
-                        cookie_override=None,
-                        authorization=None,
-                        did=None,
-                        is_active=True,
-                        template=_cfg_str(item.get("template")) or None,
-                        registration_path=_cfg_str(item.get("registration_path")) or None,
-                        invite_path=_cfg_str(item.get("invite_path")) or None,
-                    )
-                )
+    # Sync site list summary (and notify) using cached MP sites when available. The response
+    # doesn't depend on it, so it runs in the background.
+    async def _sync_summary() -> None:
+        try:
+            now = datetime.now(timezone.utc)
+            mp_sites = await _resolve_mp_sites_for_sync(ctx, app_cfg, now)
+            sites_for_sync = ctx.scanner._merge_sites(mp_sites, entries)
+            await ctx.scanner.sync_site_list_summary(sites_for_sync, now, notify=True, reason="sites_put")
+        except Exception:
+            logger.exception("failed to sync site list summary after sites put")
 
-        sites_for_sync = ctx.scanner._merge_sites(mp_sites, entries)
-        await ctx.scanner.sync_site_list_summary(sites_for_sync, now, notify=True, reason="sites_put")
-    except Exception:
-        logger.exception("failed to sync site list summary after sites put")
+    sync_task = _spawn_background(ctx, _sync_summary())
 
     scan_triggered = False
     scan_reason = ""
@@ -1375,6 +1417,8 @@ async def api_sites_put(
         scan_triggered = True
 
         async def _kick() -> None:
+            # Let the summary sync land first so the change is attributed to this upsert.
+            await sync_task
             try:
                 await ctx.scanner.run_one(domain)
             except AlreadyScanningError:
@@ -1382,15 +1426,19 @@ async def api_sites_put(
             except Exception:
                 logger.exception("auto scan after sites upsert failed: %s", domain)
 
-        asyncio.create_task(_kick())
+        _spawn_background(ctx, _kick())
 
     return {"ok": True, "scan_triggered": scan_triggered, "scan_reason": scan_reason}
 
 
-@app.delete("/api/sites/{domain}", dependencies=[Depends(require_auth)])
-async def api_sites_delete(domain: str, ctx: Annotated[AppContext, Depends(get_ctx)]) -> Dict[str, Any]:
+@api_router.delete("/sites/{domain}")
+async def api_sites_delete(
+    domain: str,
+    ctx: Annotated[AppContext, Depends(get_ctx)],
+    app_cfg: Annotated[Dict[str, Any], Depends(get_app_config)],
+    sites_cfg: Annotated[Dict[str, Any], Depends(get_sites_config)],
+) -> Dict[str, Any]:
     dom = _normalize_domain(domain)
-    sites_cfg = await _load_sites_config(ctx)
     entries = _safe_dict(sites_cfg.get("entries"))
     existed = dom in entries
     existed_mode = _cfg_str(_safe_dict(entries.get(dom)).get("mode")).lower() if existed else ""
@@ -1407,71 +1455,113 @@ async def api_sites_delete(domain: str, ctx: Annotated[AppContext, Depends(get_c
             )
         except Exception:
             pass
-        try:
-            now = datetime.now(timezone.utc)
-            app_cfg = await _load_app_config(ctx)
-            mp_cfg = _safe_dict(app_cfg.get("moviepilot"))
-            mp_base_url = _cfg_str(mp_cfg.get("base_url")) or ctx.settings.moviepilot.base_url
-            mp_sites_cache_ttl = _cfg_int(
-                mp_cfg.get("sites_cache_ttl_seconds"),
-                MP_SITES_CACHE_DEFAULT_TTL_SECONDS,
-                MP_SITES_CACHE_MIN_TTL_SECONDS,
-                MP_SITES_CACHE_MAX_TTL_SECONDS,
-            )
 
-            mp_sites: list[Site] = []
-            cache = parse_cache(await ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
-            if cache and not cache_expired(cache, now, mp_sites_cache_ttl, base_url=mp_base_url):
-                mp_sites = cache.sites
-            if not mp_sites:
-                snap_at, snap_sites = await ctx.store.load_sites_snapshot()
-                if snap_sites and snap_at and int((now - snap_at).total_seconds()) <= mp_sites_cache_ttl:
-                    mp_sites = snap_sites
-            if not mp_sites:
-                prev_summary = _safe_dict(await ctx.store.get_json(SITE_LIST_SUMMARY_KEY, default=None))
-                prev_items = _safe_dict(prev_summary.get("items"))
-                for d, item_any in prev_items.items():
-                    item = _safe_dict(item_any)
-                    if _cfg_str(item.get("source")) != "moviepilot":
-                        continue
-                    url = _cfg_str(item.get("url"))
-                    if not url:
-                        continue
-                    mp_sites.append(
-                        Site(
-                            id=0,
-                            name=_cfg_str(item.get("name")) or _normalize_domain(d),
-                            domain=_normalize_domain(d),
-                            url=url,
-                            ua=None,
-                            cookie=None,
-                            cookie_override=None,
-                            authorization=None,
-                            did=None,
-                            is_active=True,
-                            template=_cfg_str(item.get("template")) or None,
-                            registration_path=_cfg_str(item.get("registration_path")) or None,
-                            invite_path=_cfg_str(item.get("invite_path")) or None,
-                        )
-                    )
+        async def _sync_summary() -> None:
+            try:
+                now = datetime.now(timezone.utc)
+                mp_sites = await _resolve_mp_sites_for_sync(ctx, app_cfg, now)
+                sites_for_sync = ctx.scanner._merge_sites(mp_sites, entries)
+                await ctx.scanner.sync_site_list_summary(sites_for_sync, now, notify=True, reason="sites_delete")
+            except Exception:
+                logger.exception("failed to sync site list summary after sites delete")
 
-            sites_for_sync = ctx.scanner._merge_sites(mp_sites, entries)
-            await ctx.scanner.sync_site_list_summary(sites_for_sync, now, notify=True, reason="sites_delete")
-        except Exception:
-            logger.exception("failed to sync site list summary after sites delete")
+        _spawn_background(ctx, _sync_summary())
     return {"ok": True}
 
 
-def _spa_file_response() -> HTMLResponse:
-    index_path = _DIST_DIR / "index.html"
-    if not index_path.exists():
-        detail = (
-            "<h1>Web UI not built</h1>"
-            "<p>Run:</p>"
-            "<pre>npm --prefix webui install\nnpm --prefix webui run build</pre>"
-        )
-        return HTMLResponse(detail, status_code=503)
-    return HTMLResponse(index_path.read_text(encoding="utf-8"), status_code=200)
+_MP_SITES_FOR_SYNC_TTL_SECONDS = 5.0
+
+
+async def _resolve_mp_sites_for_sync(ctx: AppContext, app_cfg: Dict[str, Any], now: datetime) -> list[Site]:
+    """
+    Best-known MoviePilot site list without calling MP: fresh cache, then local snapshot, then the
+    previous site list summary. Memoized briefly so a burst of site edits decodes these once.
+    """
+    mp_cfg = _safe_dict(app_cfg.get("moviepilot"))
+    mp_base_url = _cfg_str(mp_cfg.get("base_url")) or ctx.settings.moviepilot.base_url
+    memo = ctx.mp_sites_for_sync_cache
+    if memo is not None and memo[0] > time.monotonic() and memo[1] == mp_base_url:
+        return memo[2]
+
+    mp_sites_cache_ttl = _cfg_int(
+        mp_cfg.get("sites_cache_ttl_seconds"),
+        MP_SITES_CACHE_DEFAULT_TTL_SECONDS,
+        MP_SITES_CACHE_MIN_TTL_SECONDS,
+        MP_SITES_CACHE_MAX_TTL_SECONDS,
+    )
+
+    mp_sites: list[Site] = []
+    cache = parse_cache(await ctx.store.get_json(MP_SITES_CACHE_KEY, default=None))
+    if cache and not cache_expired(cache, now, mp_sites_cache_ttl, base_url=mp_base_url):
+        mp_sites = cache.sites
+    if not mp_sites:
+        snap_at, snap_sites = await ctx.store.load_sites_snapshot()
+        if snap_sites and snap_at and int((now - snap_at).total_seconds()) <= mp_sites_cache_ttl:
+            mp_sites = snap_sites
+    if not mp_sites:
+        prev_summary = _safe_dict(await ctx.store.get_json(SITE_LIST_SUMMARY_KEY, default=None))
+        prev_items = _safe_dict(prev_summary.get("items"))
+        for dom, item_any in prev_items.items():
+            item = _safe_dict(item_any)
+            if _cfg_str(item.get("source")) != "moviepilot":
+                continue
+            url = _cfg_str(item.get("url"))
+            if not url:
+                continue
+            mp_sites.append(
+                Site(
+                    id=0,
+                    name=_cfg_str(item.get("name")) or _normalize_domain(dom),
+                    domain=_normalize_domain(dom),
+                    url=url,
+                    ua=None,
+                    cookie=None,
+                    cookie_override=None,
+                    authorization=None,
+                    did=None,
+                    is_active=True,
+                    template=_cfg_str(item.get("template")) or None,
+                    registration_path=_cfg_str(item.get("registration_path")) or None,
+                    invite_path=_cfg_str(item.get("invite_path")) or None,
+                )
+            )
+
+    ctx.mp_sites_for_sync_cache = (time.monotonic() + _MP_SITES_FOR_SYNC_TTL_SECONDS, mp_base_url, mp_sites)
+    return mp_sites
+
+
+app.include_router(api_router)
+
+
+_SPA_RESERVED_PREFIXES = ("api", "assets")
+
+
+_SPA_NOT_BUILT_HTML = (
+    "<h1>Web UI not built</h1>"
+    "<p>Run:</p>"
+    "<pre>npm --prefix webui install\nnpm --prefix webui run build</pre>"
+)
+
+
+def _load_spa_shell() -> tuple[int, bytes, str]:
+    try:
+        body = (_DIST_DIR / "index.html").read_bytes()
+    except OSError:
+        return 503, _SPA_NOT_BUILT_HTML.encode("utf-8"), ""
+    return 200, body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _spa_file_response(request: Request) -> Response:
+    # index.html only changes on deploy, so lifespan reads it once; rebuilding the UI needs a restart.
+    status_code, body, etag = getattr(app.state, "spa_shell", None) or _load_spa_shell()
+    if not etag:
+        return HTMLResponse(body, status_code=status_code)
+    # no-cache: browsers revalidate each navigation, and an unchanged shell costs a bodiless 304.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, status_code=status_code, headers=headers)
 
 
 @app.get("/favicon.svg", include_in_schema=False)
@@ -1479,13 +1569,19 @@ async def favicon() -> FileResponse:
     return FileResponse(_DIST_DIR / "favicon.svg")
 
 
-@app.get("/", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
-async def spa_root() -> HTMLResponse:
-    return _spa_file_response()
+@spa_router.get("/")
+async def spa_root(request: Request) -> Response:
+    return _spa_file_response(request)
 
 
-@app.get("/{path:path}", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
-async def spa_routes(path: str) -> HTMLResponse:
-    if path.startswith("api") or path.startswith("assets") or path in {"docs", "openapi.json", "redoc", "health"}:
+@spa_router.get("/{path:path}")
+async def spa_routes(path: str, request: Request) -> Response:
+    # /docs, /redoc, /openapi.json, /health and the /assets mount are matched before this catch-all;
+    # only unknown API/asset paths land here and must not fall back to the SPA shell.
+    if path.startswith(_SPA_RESERVED_PREFIXES):
         raise HTTPException(status_code=404)
-    return _spa_file_response()
+    return _spa_file_response(request)
+
+
+# Registered last: the SPA catch-all must not shadow any other route.
+app.include_router(spa_router)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from pt_invite_watcher.config import Settings
 from pt_invite_watcher.storage.sqlite import SqliteStore
 
+if TYPE_CHECKING:
+    from pt_invite_watcher.notify.manager import NotifierManager
+    from pt_invite_watcher.scanner import Scanner
+
 
 @dataclass
 class AppContext:
@@ -12,17 +18,31 @@ class AppContext:
     store: SqliteStore
     scanner: object
     notifier: object
+    # (expires_at monotonic, mp_base_url, sites) for the MP site list used by sites PUT/DELETE summary syncs.
+    mp_sites_for_sync_cache: Optional[Tuple[float, str, List[Any]]] = None
+    # Fire-and-forget tasks (summary syncs, deferred kv writes); the app lifespan drains them on shutdown.
+    background_tasks: Set[asyncio.Task] = field(default_factory=set)
+    # Latest value per kv key still waiting for its deferred write; flushed before the store closes.
+    pending_json_writes: Dict[str, Any] = field(default_factory=dict)
 
 
-async def build_context(settings: Settings) -> AppContext:
+def build_scanner(settings: Settings, store: SqliteStore, notifier: Optional[NotifierManager] = None) -> Scanner:
     from pt_invite_watcher.notify.manager import NotifierManager
     from pt_invite_watcher.scanner import Scanner
 
+    if notifier is None:
+        notifier = NotifierManager(store=store)
+    return Scanner(settings=settings, store=store, notifier=notifier)
+
+
+async def build_context(settings: Settings) -> AppContext:
+    from pt_invite_watcher.notify.manager import NotifierManager
+
     store = SqliteStore(settings.db.path)
     await store.init()
 
     notifier = NotifierManager(store=store)
-    scanner = Scanner(settings=settings, store=store, notifier=notifier)
+    scanner = build_scanner(settings, store, notifier=notifier)
 
     return AppContext(settings=settings, store=store, scanner=scanner, notifier=notifier)
 
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
+import logging
 import os
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 def _env(name: str, default: Optional[str] = None) -> Optional[str]:
     value = os.getenv(name)
@@ -43,43 +50,44 @@ def _as_bool(value: Any) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+_URL_SUFFIXES = ("/docs", "/docs/", "/api/v1", "/api/v1/")
+
+
 def _clean_base_url(base_url: str) -> str:
     base_url = (base_url or "").strip()
     if not base_url:
         return ""
     # Users often paste Swagger docs url like ".../docs" or an api prefix like ".../api/v1".
     # Keep any reverse-proxy prefix path, only strip these well-known suffixes.
-    while True:
-        original = base_url
-        for suffix in ("/docs", "/docs/", "/api/v1", "/api/v1/"):
+    # Suffixes can stack (".../api/v1/docs"), hence the loop; a plain URL costs one endswith call.
+    while base_url.endswith(_URL_SUFFIXES):
+        for suffix in _URL_SUFFIXES:
             if base_url.endswith(suffix):
                 base_url = base_url[: -len(suffix)]
                 break
-        if base_url == original:
-            break
     return base_url.rstrip("/")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BasicAuthSettings:
     enabled: bool
     username: str
     password: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebSettings:
     host: str
     port: int
     basic_auth: BasicAuthSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatabaseSettings:
     path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScanSettings:
     interval_seconds: int
     timeout_seconds: int
@@ -88,7 +96,7 @@ class ScanSettings:
     trust_env: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CookieCloudSettings:
     base_url: str
     uuid: str
@@ -96,13 +104,13 @@ class CookieCloudSettings:
     refresh_interval_seconds: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CookieSettings:
     source: str  # auto|cookiecloud|moviepilot
     cookiecloud: CookieCloudSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoviePilotSettings:
     base_url: str
     username: str
@@ -110,7 +118,7 @@ class MoviePilotSettings:
     otp_password: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     moviepilot: MoviePilotSettings
     cookie: CookieSettings
@@ -118,6 +126,7 @@ class Settings:
     db: DatabaseSettings
     web: WebSettings
     log_level: str
+    log_level_int: int
 
 
 def _load_yaml_config(config_path: Optional[str]) -> dict[str, Any]:
@@ -131,7 +140,7 @@ def _load_yaml_config(config_path: Optional[str]) -> dict[str, Any]:
 
     for path in candidates:
         if path.exists() and path.is_file():
-            data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            data = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
             if not isinstance(data, dict):
                 return {}
             return data
@@ -147,6 +156,10 @@ def _deep_get(obj: dict[str, Any], keys: list[str], default: Any = None) -> Any:
     return cur
 
 
+# Env and config file are fixed for the process lifetime, and Settings is frozen, so one instance is
+# shared by every caller (`run` loads it in the CLI and again in the app lifespan).
+# Call load_settings.cache_clear() to force a re-read.
+@lru_cache(maxsize=None)
 def load_settings(config_path: Optional[str] = None) -> Settings:
     cfg = _load_yaml_config(config_path)
 
@@ -178,6 +191,8 @@ def load_settings(config_path: Optional[str] = None) -> Settings:
     web_auth_enabled = bool(web_auth_username and web_auth_password)
 
     log_level = (_env("PTIW_LOG_LEVEL", "INFO") or "INFO").strip().upper()
+    level = logging.getLevelName(log_level)
+    log_level_int = level if isinstance(level, int) else logging.INFO
 
     if mp_base_url:
         parsed = urlparse(mp_base_url)
@@ -218,4 +233,5 @@ def load_settings(config_path: Optional[str] = None) -> Settings:
             ),
         ),
         log_level=log_level,
+        log_level_int=log_level_int,
     )
@@ -5,6 +5,7 @@ import re
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 from pt_invite_watcher.models import AspectResult, Evidence, Site
 from pt_invite_watcher.net import DEFAULT_REQUEST_RETRY_ATTEMPTS, DEFAULT_REQUEST_RETRY_DELAY_SECONDS, request_with_retry
@@ -15,11 +16,23 @@ logger = logging.getLogger("pt_invite_watcher.mteam")
 _PROFILE_URL = "https://api.m-team.cc/api/member/profile"
 _MAX_DETAIL_LEN = 240
 _MAX_INT_VALUE = 1_000_000
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Results are frozen dataclasses, so the fully constant one can be shared.
+_MISSING_AUTH_RESULT = AspectResult(
+    state="unknown",
+    evidence=Evidence(
+        url=_PROFILE_URL,
+        http_status=None,
+        reason="missing_auth",
+        detail="api-key (did) not configured",
+    ),
+)
 
 
 def _truncate_detail(value: str) -> str:
     text = str(value or "").strip()
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     if len(text) > _MAX_DETAIL_LEN:
         return text[: _MAX_DETAIL_LEN - 1] + "…"
     return text
@@ -38,76 +51,68 @@ def _coerce_int(value: Any) -> Optional[int]:
         return None
     if isinstance(value, str):
         s = value.strip()
-        if not s:
-            return None
-        if re.fullmatch(r"\d+", s):
+        # isdecimal() accepts exactly the Unicode Nd characters that `\d+` matched, without a regex.
+        if s.isdecimal():
             try:
                 return int(s)
-            except Exception:
+            except ValueError:
                 return None
     return None
 
 
-def _collect_numeric_fields(obj: Any, prefix: str = "") -> list[tuple[str, int]]:
-    items: list[tuple[str, int]] = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            key = str(k)
-            path = f"{prefix}.{key}" if prefix else key
-            num = _coerce_int(v)
-            if num is not None:
-                items.append((path, num))
-            else:
-                items.extend(_collect_numeric_fields(v, path))
-        return items
-    if isinstance(obj, list):
-        for i, v in enumerate(obj):
-            path = f"{prefix}[{i}]" if prefix else f"[{i}]"
-            num = _coerce_int(v)
-            if num is not None:
-                items.append((path, num))
-            else:
-                items.extend(_collect_numeric_fields(v, path))
-        return items
-    return items
-
-
-_INVITE_TOKEN_RE = re.compile(r"(invite|invitation)", re.I)
-_INVITE_VALUE_RE = re.compile(r"(count|quota|num|number|remain|left|available|rest)", re.I)
-_INVITE_EXCLUDE_RE = re.compile(r"(limit|max|min|token|code|hash|url)", re.I)
-_INVITE_TEMP_RE = re.compile(r"(temp|temporary)", re.I)
-_INVITE_TOTAL_RE = re.compile(r"(total|sum)", re.I)
+# Matched against already-lowercased paths: re.I would only make every search several times slower.
+_INVITE_TOKEN_RE = re.compile(r"(invite|invitation)")
+_INVITE_VALUE_RE = re.compile(r"(count|quota|num|number|remain|left|available|rest)")
+_INVITE_EXCLUDE_RE = re.compile(r"(limit|max|min|token|code|hash|url)")
+_INVITE_TEMP_RE = re.compile(r"(temp|temporary)")
+_INVITE_TOTAL_RE = re.compile(r"(total|sum)")
+_INVITE_LEAF_NAMES = frozenset({"invite", "invites", "invitation", "invitations", "perm", "permanent", "temp", "temporary"})
 
 
-def _extract_invite_quota(payload: Any) -> tuple[Optional[int], Optional[int], Optional[str]]:
-    fields = _collect_numeric_fields(payload)
-    candidates: list[tuple[str, int]] = []
-    for path, value in fields:
-        if value < 0 or value > _MAX_INT_VALUE:
-            continue
-        path_lower = path.lower()
-        if not _INVITE_TOKEN_RE.search(path_lower):
-            continue
-        if _INVITE_EXCLUDE_RE.search(path_lower):
-            continue
-        leaf = path.split(".")[-1].lower()
-        if _INVITE_EXCLUDE_RE.search(leaf):
-            continue
-        if not (
-            _INVITE_VALUE_RE.search(leaf)
-            or leaf in {"invite", "invites", "invitation", "invitations", "perm", "permanent", "temp", "temporary"}
-        ):
+def _push_children(
+    stack: list[tuple[Any, str, bool]], obj: Any, prefix: str, invite_in_path: bool
+) -> None:
+    if isinstance(obj, dict):
+        children = [(str(k), v) for k, v in obj.items()]
+        sep = "." if prefix else ""
+    elif isinstance(obj, list):
+        children = [(f"[{i}]", v) for i, v in enumerate(obj)]
+        sep = ""
+    else:
+        return
+    frames: list[tuple[Any, str, bool]] = []
+    for segment, value in children:
+        segment_lower = segment.lower()
+        # No token spans a path separator, so matching segment by segment equals matching the whole path:
+        # an excluded segment rejects every leaf below it, and one invite segment qualifies them all.
+        if _INVITE_EXCLUDE_RE.search(segment_lower):
             continue
-        candidates.append((path, value))
+        invite = invite_in_path or _INVITE_TOKEN_RE.search(segment_lower) is not None
+        frames.append((value, f"{prefix}{sep}{segment}", invite))
+    # Reversed so pops come out in document order (bucket ties keep the first field seen).
+    stack.extend(reversed(frames))
 
-    if not candidates:
-        return None, None, None
 
+def _extract_invite_quota(payload: Any) -> tuple[Optional[int], Optional[int], Optional[str]]:
     temp: Optional[tuple[str, int]] = None
     perm: Optional[tuple[str, int]] = None
     total: Optional[tuple[str, int]] = None
 
-    for path, value in candidates:
+    # One walk, bucketing each qualifying field as it is found; only subtrees that can still match are visited.
+    stack: list[tuple[Any, str, bool]] = []
+    _push_children(stack, payload, "", False)
+    while stack:
+        obj, path, invite_in_path = stack.pop()
+        value = _coerce_int(obj)
+        if value is None:
+            _push_children(stack, obj, path, invite_in_path)
+            continue
+        if not invite_in_path or value < 0 or value > _MAX_INT_VALUE:
+            continue
+        leaf = path.split(".")[-1].lower()
+        if leaf not in _INVITE_LEAF_NAMES and not _INVITE_VALUE_RE.search(leaf):
+            continue
+
         k = path.lower()
         if _INVITE_TEMP_RE.search(k):
             if temp is None or value > temp[1]:
@@ -120,6 +125,9 @@ def _extract_invite_quota(payload: Any) -> tuple[Optional[int], Optional[int], O
         if perm is None or value > perm[1]:
             perm = (path, value)
 
+    if perm is None and temp is None and total is None:
+        return None, None, None
+
     perm_value = perm[1] if perm else None
     temp_value = temp[1] if temp else None
     total_value = total[1] if total else None
@@ -146,6 +154,14 @@ def _extract_invite_quota(payload: Any) -> tuple[Optional[int], Optional[int], O
     return perm_value, temp_value or 0, matched
 
 
+def _load_json(resp: httpx.Response) -> Any:
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        # orjson only takes UTF-8; httpx's decoder also handles other charsets and a BOM.
+        return resp.json()
+
+
 class MTeamDetector:
     async def check_invites(
         self,
@@ -159,15 +175,7 @@ class MTeamDetector:
         api_key = (site.did or "").strip()
         authorization = (site.authorization or "").strip()
         if not api_key:
-            return AspectResult(
-                state="unknown",
-                evidence=Evidence(
-                    url=_PROFILE_URL,
-                    http_status=None,
-                    reason="missing_auth",
-                    detail="api-key (did) not configured",
-                ),
-            )
+            return _MISSING_AUTH_RESULT
 
         headers: dict[str, str] = {
             "Accept": "application/json, text/plain, */*",
@@ -217,7 +225,7 @@ class MTeamDetector:
             )
 
         try:
-            payload = resp.json()
+            payload = _load_json(resp)
         except Exception as e:
             detail = _truncate_detail(str(e))
             return AspectResult(
@@ -274,8 +282,11 @@ class MTeamDetector:
             perm = perm or 0
             temp = temp or 0
             matched = "invites/limitInvites"
-        else:
+        elif b"invit" in resp.content.lower():
+            # Every field the walk accepts sits under an "invite"/"invitation" key, so without those bytes
+            # in the raw body there is nothing to find and the profile isn't walked at all.
             perm, temp, matched = _extract_invite_quota(data)
+            logger.debug("mteam invites/limitInvites missing for %s, scanned profile: %s", site.domain, matched)
         if perm is None:
             return AspectResult(
                 state="unknown",
@@ -21,10 +21,13 @@ _HTTP_RETRY_ATTEMPTS = DEFAULT_REQUEST_RETRY_ATTEMPTS
 _MAX_ERROR_DETAIL_LEN = 240
 _MAX_SIGNUP_SNIPPET_LEN = 160
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+
 
 def _format_error_detail(exc: Exception) -> str:
     msg = str(exc or "").strip() or type(exc).__name__
-    msg = re.sub(r"\s+", " ", msg)
+    msg = _WHITESPACE_RE.sub(" ", msg)
     if len(msg) > _MAX_ERROR_DETAIL_LEN:
         msg = msg[: _MAX_ERROR_DETAIL_LEN - 1] + "…"
     return msg
@@ -38,7 +41,7 @@ def _truncate_detail(text: str, limit: int = _MAX_ERROR_DETAIL_LEN) -> str:
 
 
 def _extract_html_title(raw_html: str) -> str:
-    m = re.search(r"<title[^>]*>(.*?)</title>", raw_html or "", flags=re.I | re.S)
+    m = _TITLE_RE.search(raw_html or "")
     if not m:
         return ""
     title = html_lib.unescape(m.group(1) or "")
@@ -100,7 +103,7 @@ def _looks_like_login(resp: httpx.Response) -> bool:
 
 
 def _normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "").strip())
+    return _WHITESPACE_RE.sub(" ", (text or "").strip())
 
 
 def _extract_text(resp: httpx.Response) -> str:
@@ -132,8 +135,9 @@ def _has_signup_form(resp: httpx.Response) -> bool:
         return False
 
 
-def _is_registration_closed(text: str) -> Optional[str]:
-    patterns = [
+_REGISTRATION_CLOSED_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"registration\s+closed",
         r"signups?\s+(are\s+)?closed",
         r"signup\s+closed",
@@ -147,15 +151,20 @@ def _is_registration_closed(text: str) -> Optional[str]:
         r"自由注册.{0,10}关闭",
         r"(?:自由|开放)注册.{0,10}打烊",
         r"(?:只|仅)(?:允许|接受).{0,10}邀请注册",
-    ]
-    for pat in patterns:
-        if re.search(pat, text, flags=re.I):
-            return pat
+    )
+)
+
+
+def _is_registration_closed(text: str) -> Optional[str]:
+    for regex in _REGISTRATION_CLOSED_RES:
+        if regex.search(text):
+            return regex.pattern
     return None
 
 
-def _parse_invite_count(text: str) -> tuple[Optional[int], Optional[str]]:
-    patterns = [
+_INVITE_COUNT_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"you\s+have\s+(\d{1,4})\s+invites?",
         r"available\s+invites?\s*[:：]\s*(\d{1,4})",
         r"invites?\s*available\s*[:：]\s*(\d{1,4})",
@@ -163,9 +172,13 @@ def _parse_invite_count(text: str) -> tuple[Optional[int], Optional[str]]:
         r"可用(?:邀请|邀請)\s*[:：]?\s*(\d{1,4})",
         r"(?:剩余|剩餘)(?:邀请|邀請)\s*[:：]?\s*(\d{1,4})",
         r"(?:你|您)\s*(?:还|還)?\s*有\s*(\d{1,4})\s*(?:个)?\s*(?:邀请|邀請)",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text, flags=re.I)
+    )
+)
+
+
+def _parse_invite_count(text: str) -> tuple[Optional[int], Optional[str]]:
+    for regex in _INVITE_COUNT_RES:
+        m = regex.search(text)
         if not m:
             continue
         try:
@@ -175,28 +188,38 @@ def _parse_invite_count(text: str) -> tuple[Optional[int], Optional[str]]:
     return None, None
 
 
-def _is_invite_disabled(text: str) -> Optional[str]:
-    patterns = [
+_INVITE_DISABLED_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"invites?\s+(are\s+)?disabled",
         r"inviting\s+is\s+disabled",
         r"you\s+are\s+not\s+allowed\s+to\s+invite",
         r"邀请功能(已经)?关闭",
         r"禁止邀请",
         r"无邀请权限",
-    ]
-    for pat in patterns:
-        if re.search(pat, text, flags=re.I):
-            return pat
+    )
+)
+
+
+def _is_invite_disabled(text: str) -> Optional[str]:
+    for regex in _INVITE_DISABLED_RES:
+        if regex.search(text):
+            return regex.pattern
     return None
 
 
-def _parse_home_invite_quota(text: str) -> tuple[Optional[int], Optional[int], Optional[str]]:
-    patterns = [
+_HOME_INVITE_QUOTA_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"(?:邀请|邀請)\s*\[\s*(?:发送|發送)\s*\]\s*[:：]?\s*(\d{1,4})\s*(?:\(\s*(\d{1,4})\s*\))?",
         r"\[\s*(?:邀请|邀請)\s*\]\s*[:：]?\s*(\d{1,4})\s*(?:\(\s*(\d{1,4})\s*\))?",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text, flags=re.I)
+    )
+)
+
+
+def _parse_home_invite_quota(text: str) -> tuple[Optional[int], Optional[int], Optional[str]]:
+    for regex in _HOME_INVITE_QUOTA_RES:
+        m = regex.search(text)
         if not m:
             continue
         try:
@@ -208,20 +231,20 @@ def _parse_home_invite_quota(text: str) -> tuple[Optional[int], Optional[int], O
     return None, None, None
 
 
+_USER_ID_RES = (
+    (re.compile(r"userdetails\.php\?id=(\d{1,10})", re.I), "userdetail"),
+    (re.compile(r"\bUID\s*=\s*(\d{1,10})\b", re.I), "home"),
+    (re.compile(r"\buser(?:id|_id)\s*=\s*(\d{1,10})\b", re.I), "home"),
+    (re.compile(r"\buid\s*=\s*(\d{1,10})\b", re.I), "home"),
+)
+
+
 def _extract_user_id_and_source(html: str) -> tuple[Optional[str], Optional[str]]:
     raw = html or ""
-    m = re.search(r"userdetails\.php\?id=(\d{1,10})", raw, flags=re.I)
-    if m:
-        return m.group(1), "userdetail"
-    m = re.search(r"\bUID\s*=\s*(\d{1,10})\b", raw, flags=re.I)
-    if m:
-        return m.group(1), "home"
-    m = re.search(r"\buser(?:id|_id)\s*=\s*(\d{1,10})\b", raw, flags=re.I)
-    if m:
-        return m.group(1), "home"
-    m = re.search(r"\buid\s*=\s*(\d{1,10})\b", raw, flags=re.I)
-    if m:
-        return m.group(1), "home"
+    for regex, source in _USER_ID_RES:
+        m = regex.search(raw)
+        if m:
+            return m.group(1), source
     return None, None
 
 
@@ -284,8 +307,9 @@ def _extract_invite_url_from_html(html: str, base_url: str) -> Optional[str]:
         return None
 
 
-def _invite_permission_denied(text: str) -> Optional[str]:
-    patterns = [
+_PERMISSION_DENIED_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"对不起[,，]?\s*.+?(?:这里|返回)",
         r"(?:或以上|及以上).{0,80}(?:才可(?:以)?|才能).{0,20}(?:发送|發送).{0,10}(?:邀请|邀請)",
         r"只有.{0,80}(?:才可(?:以)?|才能).{0,20}(?:发送|發送).{0,10}(?:邀请|邀請)",
@@ -293,10 +317,14 @@ def _invite_permission_denied(text: str) -> Optional[str]:
         r"(?:当前)?账户上限|上限数已到|已达到最大邀请数|已达上限|达到上限|当前邀请注册人数已达上限",
         r"(?:你|您).{0,30}(?:没有|無).{0,30}(?:邀请|邀請).{0,20}(?:权限|權限)",
         r"(?:not\s+allowed\s+to\s+invite|invites?\s+are\s+disabled)",
-    ]
-    for pat in patterns:
-        if re.search(pat, text, flags=re.I):
-            return pat
+    )
+)
+
+
+def _invite_permission_denied(text: str) -> Optional[str]:
+    for regex in _PERMISSION_DENIED_RES:
+        if regex.search(text):
+            return regex.pattern
     return None
 
 
@@ -304,15 +332,34 @@ def _invite_permission_denied_any(text: str, raw_html: str) -> Optional[str]:
     return _invite_permission_denied(text) or _invite_permission_denied(raw_html or "")
 
 
+_REASON_BACK_LINK_RE = re.compile(r"\s*这里.*返回。?$")
+_REASON_HERE_TAIL_RE = re.compile(r"\s*这里.*$")
+
+
 def _clean_invite_reason(text: str) -> str:
     s = _normalize_text(text or "")
     if not s:
         return ""
-    s = re.sub(r"\s*这里.*返回。?$", "", s)
-    s = re.sub(r"\s*这里.*$", "", s)
+    s = _REASON_BACK_LINK_RE.sub("", s)
+    s = _REASON_HERE_TAIL_RE.sub("", s)
     return s.strip(" ,，。;；")
 
 
+_SORRY_ZH_RE = re.compile(r"对不起[,，]?\s*(.*)")
+_SORRY_EN_RE = re.compile(r"sorry[,\\s]*([^\\n\\r]+)", re.I)
+_PERMISSION_REASON_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
+        r"只有.{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
+        r"(?:或以上|及以上).{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
+        r"(?:贵宾|VIP).{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
+        r"(?:当前)?账户上限.*",
+        r"(?:上限数已到|已达到最大邀请数|已达上限|达到上限|当前邀请注册人数已达上限)",
+        r"(?:你|您).{0,60}(?:没有|無).{0,60}(?:邀请|邀請).{0,20}(?:权限|權限)",
+    )
+)
+
+
 def _extract_invite_permission_reason(text: str) -> Optional[str]:
     """
     Extract a human-readable "permission denied" reason from the invite page text.
@@ -323,24 +370,16 @@ def _extract_invite_permission_reason(text: str) -> Optional[str]:
         return None
 
     if "对不起" in t:
-        m = re.search(r"对不起[,，]?\s*(.*)", t)
+        m = _SORRY_ZH_RE.search(t)
         reason = _clean_invite_reason(m.group(1) if m else t)
         return reason or "对不起"
     if "sorry" in t.lower():
-        m = re.search(r"sorry[,\\s]*([^\\n\\r]+)", t, flags=re.I)
+        m = _SORRY_EN_RE.search(t)
         reason = _clean_invite_reason(m.group(1) if m else t)
         return reason or "Sorry"
 
-    patterns = [
-        r"只有.{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
-        r"(?:或以上|及以上).{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
-        r"(?:贵宾|VIP).{0,120}(?:才可(?:以)?|才能).{0,30}(?:发送|發送).{0,20}(?:邀请|邀請)",
-        r"(?:当前)?账户上限.*",
-        r"(?:上限数已到|已达到最大邀请数|已达上限|达到上限|当前邀请注册人数已达上限)",
-        r"(?:你|您).{0,60}(?:没有|無).{0,60}(?:邀请|邀請).{0,20}(?:权限|權限)",
-    ]
-    for pat in patterns:
-        m = re.search(pat, t, flags=re.I)
+    for regex in _PERMISSION_REASON_RES:
+        m = regex.search(t)
         if not m:
             continue
         reason = _clean_invite_reason(m.group(0))
@@ -349,19 +388,24 @@ def _extract_invite_permission_reason(text: str) -> Optional[str]:
     return None
 
 
-def _extract_invite_quota_insufficient(text: str) -> Optional[str]:
-    t = _normalize_text(text or "")
-    if not t:
-        return None
-    patterns = [
+_QUOTA_INSUFFICIENT_RES = tuple(
+    re.compile(pat, re.I)
+    for pat in (
         r"邀请数量不足",
         r"邀请名额不足",
         r"没有剩余邀请",
         r"没有足够的邀请",
-    ]
-    for pat in patterns:
-        if re.search(pat, t, flags=re.I):
-            return pat
+    )
+)
+
+
+def _extract_invite_quota_insufficient(text: str) -> Optional[str]:
+    t = _normalize_text(text or "")
+    if not t:
+        return None
+    for regex in _QUOTA_INSUFFICIENT_RES:
+        if regex.search(t):
+            return regex.pattern
     return None
 
 
@@ -374,6 +418,9 @@ def _extract_action_label(tag: Any) -> str:
         return ""
 
 
+_SEND_INVITE_LABEL_RE = re.compile(r"(?:发送|發送).{0,5}(?:邀请|邀請)|send\\s+invite", re.I)
+
+
 def _invite_send_action_status(raw_html: str) -> tuple[Optional[bool], Optional[str]]:
     """
     Returns (status, matched):
@@ -421,7 +468,7 @@ def _invite_send_action_status(raw_html: str) -> tuple[Optional[bool], Optional[
         label = _extract_action_label(ctl)
         if not label:
             continue
-        if re.search(r"(?:发送|發送).{0,5}(?:邀请|邀請)|send\\s+invite", label, flags=re.I):
+        if _SEND_INVITE_LABEL_RE.search(label):
             return False, label
 
     return None, None
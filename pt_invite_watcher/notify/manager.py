@@ -25,7 +25,7 @@ class NotifierManager:
 
     async def _request_retry_delay_seconds(self) -> int:
         try:
-            cfg = await self._store.get_json("app_config", default={}) or {}
+            cfg = await self._store.get_json_cached("app_config", default={}) or {}
             connectivity = cfg.get("connectivity") if isinstance(cfg, dict) else None
             conn_dict = connectivity if isinstance(connectivity, dict) else {}
             return self._cfg_int(
@@ -39,7 +39,7 @@ class NotifierManager:
 
     async def test(self, channel: str) -> tuple[bool, str]:
         retry_delay = await self._request_retry_delay_seconds()
-        cfg = await self._store.get_json("notifications", default={})
+        cfg = await self._store.get_json_cached("notifications", default={})
         if channel == "telegram":
             telegram = cfg.get("telegram") or {}
             if not telegram.get("enabled"):
@@ -100,7 +100,7 @@ class NotifierManager:
         return False, "unknown channel"
 
     async def send(self, title: str, text: str) -> None:
-        cfg = await self._store.get_json("notifications", default={})
+        cfg = await self._store.get_json_cached("notifications", default={})
         retry_delay = await self._request_retry_delay_seconds()
 
         telegram = cfg.get("telegram") or {}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
@@ -39,7 +40,14 @@ from pt_invite_watcher.providers.moviepilot_sites_cache import (
     cache_expired,
     parse_cache,
 )
-from pt_invite_watcher.site_list import SITE_LIST_SUMMARY_KEY, build_summary, diff_summary, format_diff_lines
+from pt_invite_watcher.site_list import (
+    SITE_LIST_SUMMARY_KEY,
+    TEMPLATE_DEFAULT_PATHS,
+    build_summary,
+    diff_summary,
+    format_diff_lines,
+    join_url,
+)
 from pt_invite_watcher.storage.sqlite import SqliteStore
 
 
@@ -47,6 +55,8 @@ logger = logging.getLogger("pt_invite_watcher.scanner")
 
 _MAX_ERROR_DETAIL_LEN = 240
 _DOWN_HTTP_STATUSES = set(range(520, 530))
+# Bounds staleness from time-based inputs (MP sites cache TTL); writes invalidate immediately.
+_DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS = 30.0
 
 
 class AlreadyScanningError(RuntimeError):
@@ -141,6 +151,15 @@ def _normalize_domain(domain: str) -> str:
     return (domain or "").strip().lower()
 
 
+def _infer_engine(domain: str, template: str) -> str:
+    t = (template or "").strip().lower()
+    if not t:
+        if domain.endswith("m-team.cc"):
+            return "mteam"
+        return "nexusphp"
+    return t
+
+
 class Scanner:
     def __init__(self, settings: Settings, store: SqliteStore, notifier: NotifierManager):
         self._settings = settings
@@ -152,26 +171,158 @@ class Scanner:
         self._detector = NexusPhpDetector()
         self._mteam = MTeamDetector()
         self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._dashboard_snapshot: Optional[tuple[float, int, Dict[str, Any]]] = None
 
     def in_flight_domains(self) -> set[str]:
         return set(list(self._in_flight.keys()))
 
     async def _load_app_config(self) -> dict[str, Any]:
         try:
-            data = await self._store.get_json("app_config", default={})
+            data = await self._store.get_json_cached("app_config", default={})
             return _safe_dict(data)
         except Exception:
             return {}
 
     async def _load_sites_config(self) -> dict[str, Any]:
         try:
-            data = await self._store.get_json("sites", default={"version": 1, "entries": {}})
+            data = await self._store.get_json_cached("sites", default={"version": 1, "entries": {}})
             cfg = _safe_dict(data)
             entries = _safe_dict(cfg.get("entries"))
             return {"entries": entries}
         except Exception:
             return {"entries": {}}
 
+    async def dashboard_view(self) -> Dict[str, Any]:
+        """Merged dashboard rows (without `scanning` flags), rebuilt only when the store changed."""
+        snap = self._dashboard_snapshot
+        if (
+            snap is not None
+            and snap[1] == self._store.revision
+            and time.monotonic() - snap[0] < _DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            return snap[2]
+        return await self._refresh_dashboard_snapshot()
+
+    async def _safe_refresh_dashboard_snapshot(self) -> None:
+        try:
+            await self._refresh_dashboard_snapshot()
+        except Exception:
+            logger.exception("dashboard snapshot refresh failed")
+
+    async def _refresh_dashboard_snapshot(self) -> Dict[str, Any]:
+        # Capture the revision first so writes landing mid-build invalidate the result.
+        revision = self._store.revision
+        view = await self._build_dashboard_view()
+        self._dashboard_snapshot = (time.monotonic(), revision, view)
+        return view
+
+    async def _build_dashboard_view(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+
+        async def _optional(coro: Any, fallback: Any) -> Any:
+            try:
+                return await coro
+            except Exception:
+                return fallback
+
+        # Independent store reads; only the extras lookup below depends on the merged site list.
+        cfg, cache_raw, snapshot, sites_cfg, states, scan_status, scan_hint = await asyncio.gather(
+            self._load_app_config(),
+            _optional(self._store.get_json(MP_SITES_CACHE_KEY, default=None), None),
+            _optional(self._store.load_sites_snapshot(), (None, [])),
+            self._load_sites_config(),
+            self._store.list_site_states(),
+            self._store.get_json("scan_status", default=None),
+            self._store.get_json("scan_hint", default=None),
+        )
+
+        mp_cfg = _safe_dict(cfg.get("moviepilot"))
+        ui_cfg = _safe_dict(cfg.get("ui"))
+        mp_base_url = _cfg_str(mp_cfg.get("base_url")) or self._settings.moviepilot.base_url
+        mp_sites_cache_ttl = _cfg_int(
+            mp_cfg.get("sites_cache_ttl_seconds"),
+            MP_SITES_CACHE_DEFAULT_TTL_SECONDS,
+            MP_SITES_CACHE_MIN_TTL_SECONDS,
+            MP_SITES_CACHE_MAX_TTL_SECONDS,
+        )
+
+        mp_sites = []
+        try:
+            cache = parse_cache(cache_raw)
+            if cache and not cache_expired(cache, now, mp_sites_cache_ttl, base_url=mp_base_url):
+                mp_sites = cache.sites
+        except Exception:
+            mp_sites = []
+        if not mp_sites:
+            try:
+                snap_at, snap_sites = snapshot
+                if snap_sites and snap_at and int((now - snap_at).total_seconds()) <= mp_sites_cache_ttl:
+                    mp_sites = snap_sites
+            except Exception:
+                mp_sites = []
+
+        sites = self._merge_sites(mp_sites, _safe_dict(sites_cfg.get("entries")))
+        # _merge_sites and list_site_states both yield normalized, non-empty domains.
+        current_domains = [s.domain for s in sites]
+
+        state_map = {r["domain"]: r for r in states if r["domain"]}
+
+        extras_map: Dict[str, Dict[str, Any]] = {}
+        try:
+            extras_map = await self._store.get_sites_extras(current_domains)
+        except Exception:
+            extras_map = {}
+
+        rows: list[dict[str, Any]] = []
+        for site in sites:
+            domain = site.domain
+            row = dict(state_map.get(domain) or {})
+
+            template = _cfg_str(getattr(site, "template", None)).lower()
+            engine = _cfg_str(row.get("engine")) or _infer_engine(domain, template)
+            row["domain"] = domain
+            row["name"] = _cfg_str(getattr(site, "name", None)) or row.get("name") or domain
+            row["url"] = _cfg_str(getattr(site, "url", None)) or row.get("url") or ""
+            row["engine"] = engine
+
+            if "reachability_state" not in row:
+                row["reachability_state"] = "unknown"
+            if "reachability_note" not in row:
+                row["reachability_note"] = ""
+            if "registration_state" not in row:
+                row["registration_state"] = "unknown"
+            if "registration_note" not in row:
+                row["registration_note"] = ""
+            if "invites_state" not in row:
+                row["invites_state"] = "unknown"
+            if "invites_available" not in row:
+                row["invites_available"] = None
+            if "invites_display" not in row:
+                row["invites_display"] = ""
+            if "last_checked_at" not in row:
+                row["last_checked_at"] = ""
+            if "last_changed_at" not in row:
+                row["last_changed_at"] = None
+            if "errors" not in row:
+                row["errors"] = []
+
+            base_url = row["url"]
+            reg_default, inv_default = TEMPLATE_DEFAULT_PATHS.get(template or "nexusphp", ("", ""))
+            reg_path = _cfg_str(getattr(site, "registration_path", None)) or reg_default
+            inv_path = _cfg_str(getattr(site, "invite_path", None)) or inv_default
+
+            invite_uid = _cfg_str((extras_map.get(domain) or {}).get("invite_uid")) if template in {"", "nexusphp"} else ""
+            if invite_uid:
+                inv_path = f"invite.php?id={invite_uid}"
+
+            row["registration_url"] = join_url(base_url, reg_path) if base_url and reg_path else ""
+            row["invite_url"] = join_url(base_url, inv_path) if base_url and inv_path else ""
+
+            rows.append(row)
+
+        ui = {"allow_state_reset": _cfg_bool(ui_cfg.get("allow_state_reset"), default=True)}
+        return {"rows": rows, "scan_status": scan_status, "scan_hint": scan_hint, "ui": ui}
+
     async def sync_site_list_summary(
         self,
         sites: list[Site],
@@ -883,6 +1034,7 @@ class Scanner:
             await self._store.set_json("scan_hint", None)
         except Exception:
             pass
+        await self._safe_refresh_dashboard_snapshot()
         return status
 
     async def run_one(self, domain: str) -> Dict[str, Any]:
@@ -1023,6 +1175,7 @@ class Scanner:
             await self._store.set_json("scan_hint", None)
         except Exception:
             pass
+        await self._safe_refresh_dashboard_snapshot()
         return status
 
     async def _log_step(
@@ -10,6 +10,12 @@ from pt_invite_watcher.models import Site
 SITE_LIST_SUMMARY_KEY = "effective_sites_summary"
 SITE_LIST_SUMMARY_VERSION = 1
 
+# Default (registration, invite) page paths per template; "custom" sites have none.
+TEMPLATE_DEFAULT_PATHS: dict[str, tuple[str, str]] = {
+    "nexusphp": ("signup.php", "invite.php"),
+    "mteam": ("signup", "invite"),
+}
+
 
 def _safe_str(value: Any) -> str:
     if value is None:
@@ -31,9 +37,15 @@ def _normalize_template(site: Site) -> str:
 
 
 def _default_paths(template: str) -> tuple[str, str]:
-    if template == "mteam":
-        return "signup", "invite"
-    return "signup.php", "invite.php"
+    return TEMPLATE_DEFAULT_PATHS.get(template, TEMPLATE_DEFAULT_PATHS["nexusphp"])
+
+
+def join_url(base_url: str, path: str) -> str:
+    # Paths here are site-relative ("invite.php?id=1", "signup"), so plain concatenation matches
+    # urljoin against a slash-terminated site root without re-parsing both URLs.
+    if path.startswith(("http://", "https://")):
+        return path
+    return base_url.rstrip("/") + "/" + path.lstrip("/")
 
 
 def _effective_paths(site: Site, template: str) -> tuple[str, str]:
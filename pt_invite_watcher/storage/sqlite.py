@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -10,10 +9,19 @@ from typing import Any, Callable, Dict, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import aiosqlite
+import orjson
 from urllib.parse import parse_qs
 
 from pt_invite_watcher.models import Site, SiteCheckResult, to_jsonable
 
+logger = logging.getLogger("pt_invite_watcher.storage")
+
+# Events are buffered and written in batches: one commit + one trim per batch instead of per event.
+_EVENT_FLUSH_DELAY_SECONDS = 0.05
+_EVENT_FLUSH_BATCH_SIZE = 100
+
+_JSON_MISSING = object()
+
 
 @dataclass(frozen=True)
 class StoredSiteState:
@@ -111,6 +119,17 @@ class SqliteStore:
         self._path = path
         self._conn: Optional[aiosqlite.Connection] = None
         self._event_hooks: list[Callable[[dict[str, Any]], Any]] = []
+        self._event_buffer: list[tuple[Any, ...]] = []
+        self._event_flush_task: Optional[asyncio.Task] = None
+        self._event_flush_lock = asyncio.Lock()
+        self._revision = 0
+        # Decoded kv values served by get_json_cached; set_json drops the key it writes.
+        self._json_cache: dict[str, Any] = {}
+
+    @property
+    def revision(self) -> int:
+        """Bumped on every site-state / kv write; lets callers cache derived views."""
+        return self._revision
 
     def on_event(self, hook: Callable[[dict[str, Any]], Any]) -> None:
         self._event_hooks.append(hook)
@@ -181,8 +200,9 @@ class SqliteStore:
         """
         Append a structured event log row.
         Keep the latest `max_rows` rows to avoid unbounded growth.
+        Rows are buffered and flushed shortly after (or once the buffer fills); readers flush first.
         """
-        conn = self._require_conn()
+        self._require_conn()
         ts = datetime.now(timezone.utc).isoformat()
         cat = str(category or "misc").strip().lower() or "misc"
         lvl = str(level or "info").strip().lower() or "info"
@@ -192,35 +212,62 @@ class SqliteStore:
         det = None
         if detail is not None:
             try:
-                det = json.dumps(detail, ensure_ascii=False)
+                det = orjson.dumps(detail, option=orjson.OPT_NON_STR_KEYS).decode()
             except Exception:
-                det = json.dumps({"detail": str(detail)}, ensure_ascii=False)
-
-        cursor = await conn.execute(
-            """
-            INSERT INTO event_log(ts, category, level, action, domain, message, detail)
-            VALUES(?, ?, ?, ?, ?, ?, ?)
-            """,
-            (ts, cat, lvl, act, dom, msg, det),
-        )
-        row_id = cursor.lastrowid
-        await cursor.close()
+                det = orjson.dumps({"detail": str(detail)}).decode()
 
         keep = max(100, int(max_rows or 0))
-        # Keep only the latest `keep` rows (delete oldest if needed).
-        await conn.execute(
-            """
-            DELETE FROM event_log
-            WHERE id <= (
-              SELECT id FROM event_log ORDER BY id DESC LIMIT 1 OFFSET ?
-            )
-            """,
-            (keep,),
-        )
-        await conn.commit()
+        self._event_buffer.append((ts, cat, lvl, act, dom, msg, det, detail, keep))
+        if len(self._event_buffer) >= _EVENT_FLUSH_BATCH_SIZE:
+            await self._flush_events()
+        elif self._event_flush_task is None:
+            self._event_flush_task = asyncio.create_task(self._flush_events_later())
+
+    async def _flush_events_later(self) -> None:
+        try:
+            await asyncio.sleep(_EVENT_FLUSH_DELAY_SECONDS)
+        finally:
+            self._event_flush_task = None
+        await self._flush_events()
+
+    async def _flush_events(self) -> None:
+        async with self._event_flush_lock:
+            if not self._event_buffer or not self._conn:
+                return
+            batch, self._event_buffer = self._event_buffer, []
+            conn = self._conn
+            row_ids: list[Optional[int]] = []
+            try:
+                for ts, cat, lvl, act, dom, msg, det, _detail, _keep in batch:
+                    cursor = await conn.execute(
+                        """
+                        INSERT INTO event_log(ts, category, level, action, domain, message, detail)
+                        VALUES(?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (ts, cat, lvl, act, dom, msg, det),
+                    )
+                    row_ids.append(cursor.lastrowid)
+                    await cursor.close()
+
+                # Keep only the latest `keep` rows (delete oldest if needed).
+                await conn.execute(
+                    """
+                    DELETE FROM event_log
+                    WHERE id <= (
+                      SELECT id FROM event_log ORDER BY id DESC LIMIT 1 OFFSET ?
+                    )
+                    """,
+                    (min(row[-1] for row in batch),),
+                )
+                await conn.commit()
+            except Exception:
+                logger.exception("failed to write %d event log rows", len(batch))
+                return
 
         # Fire hooks
-        if self._event_hooks:
+        if not self._event_hooks:
+            return
+        for row_id, (ts, cat, lvl, act, dom, msg, _det, detail, _keep) in zip(row_ids, batch):
             evt = {
                 "id": row_id,
                 "ts": ts,
@@ -234,14 +281,14 @@ class SqliteStore:
             # Calculate detail page kind if possible
             if detail and isinstance(detail, dict):
                 _enrich_event_page(evt)
-            
+
             for hook in self._event_hooks:
                 try:
                     res = hook(evt)
                     if asyncio.iscoroutine(res):
                         asyncio.create_task(res)
                 except Exception:
-                    logging.getLogger("pt_invite_watcher.storage").exception("event hook failed")
+                    logger.exception("event hook failed")
 
     async def list_events(
         self,
@@ -252,6 +299,7 @@ class SqliteStore:
         limit: int = 200,
     ) -> list[dict[str, Any]]:
         conn = self._require_conn()
+        await self._flush_events()
         cat = (str(category or "all").strip().lower() or "all")
         dom = (str(domain or "").strip().lower() or "").strip()
         kw = (str(keyword or "").strip() or "").strip()
@@ -288,7 +336,7 @@ class SqliteStore:
             detail = item.get("detail")
             if detail:
                 try:
-                    item["detail"] = json.loads(detail)
+                    item["detail"] = orjson.loads(detail)
                 except Exception:
                     item["detail"] = str(detail)
             else:
@@ -303,11 +351,13 @@ class SqliteStore:
 
     async def clear_events(self) -> None:
         conn = self._require_conn()
+        await self._flush_events()
         await conn.execute("DELETE FROM event_log")
         await conn.commit()
 
     async def get_log_domains(self) -> list[str]:
         conn = self._require_conn()
+        await self._flush_events()
         cur = await conn.execute("SELECT DISTINCT domain FROM event_log WHERE domain IS NOT NULL AND domain != '' ORDER BY domain")
         rows = await cur.fetchall()
         return [str(r[0]) for r in rows if r[0]]
@@ -315,6 +365,10 @@ class SqliteStore:
 
 
     async def close(self) -> None:
+        if self._event_flush_task is not None:
+            self._event_flush_task.cancel()
+            self._event_flush_task = None
+        await self._flush_events()
         if self._conn:
             await self._conn.close()
             self._conn = None
@@ -371,7 +425,7 @@ class SqliteStore:
             return None
         reachability_state = "unknown"
         try:
-            payload = json.loads(row["last_evidence"] or "{}")
+            payload = orjson.loads(row["last_evidence"] or "{}")
             if isinstance(payload, dict):
                 reach = payload.get("reachability")
                 if isinstance(reach, dict):
@@ -390,7 +444,7 @@ class SqliteStore:
 
     async def save_site_result(self, result: SiteCheckResult, changed_at: Optional[str]) -> None:
         conn = self._require_conn()
-        evidence_json = json.dumps(to_jsonable(result), ensure_ascii=False)
+        evidence_json = orjson.dumps(to_jsonable(result), option=orjson.OPT_NON_STR_KEYS).decode()
         checked_at = result.checked_at.isoformat()
         changed_at_value = changed_at.strip() if isinstance(changed_at, str) else None
         if not changed_at_value:
@@ -419,7 +473,7 @@ class SqliteStore:
               last_changed_at=COALESCE(excluded.last_changed_at, site_state.last_changed_at)
             """,
             (
-                result.site.domain,
+                (result.site.domain or "").strip().lower(),
                 result.site.name,
                 result.site.url,
                 result.engine,
@@ -432,6 +486,7 @@ class SqliteStore:
             ),
         )
         await conn.commit()
+        self._revision += 1
 
     async def list_site_states(self) -> list[dict[str, Any]]:
         conn = self._require_conn()
@@ -447,9 +502,11 @@ class SqliteStore:
         items: list[dict[str, Any]] = []
         for r in rows:
             item = dict(r)
+            # Keys are normalized on write; this also covers rows saved before that was the case.
+            item["domain"] = str(item.get("domain") or "").strip().lower()
             errors: list[str] = []
             try:
-                payload = json.loads(item.get("last_evidence") or "{}")
+                payload = orjson.loads(item.get("last_evidence") or "{}")
                 reach = (payload.get("reachability") or {}) if isinstance(payload, dict) else {}
                 reach_ev = (reach.get("evidence") or {}) if isinstance(reach, dict) else {}
 
@@ -532,6 +589,7 @@ class SqliteStore:
         conn = self._require_conn()
         await conn.execute("DELETE FROM site_state")
         await conn.commit()
+        self._revision += 1
 
     async def get_reachability_states(self, domains: list[str]) -> dict[str, str]:
         conn = self._require_conn()
@@ -557,7 +615,7 @@ class SqliteStore:
                 continue
             state = "unknown"
             try:
-                payload = json.loads(r["last_evidence"] or "{}")
+                payload = orjson.loads(r["last_evidence"] or "{}")
                 reach = payload.get("reachability") if isinstance(payload, dict) else None
                 if isinstance(reach, dict):
                     state = str(reach.get("state") or "unknown")
@@ -607,7 +665,7 @@ class SqliteStore:
             reachability_state = "unknown"
             invite_uid: Optional[str] = None
             try:
-                payload = json.loads(r["last_evidence"] or "{}")
+                payload = orjson.loads(r["last_evidence"] or "{}")
                 reach = payload.get("reachability") if isinstance(payload, dict) else None
                 if isinstance(reach, dict):
                     reachability_state = str(reach.get("state") or "unknown")
@@ -679,7 +737,7 @@ class SqliteStore:
             is_active = True
             site_id: Optional[int] = 0
             try:
-                payload = json.loads(r["last_evidence"] or "{}")
+                payload = orjson.loads(r["last_evidence"] or "{}")
                 if isinstance(payload, dict):
                     site_payload = payload.get("site")
                     if isinstance(site_payload, dict):
@@ -719,14 +777,25 @@ class SqliteStore:
         if not row:
             return default
         try:
-            return json.loads(row["value"])
-        except json.JSONDecodeError:
+            return orjson.loads(row["value"])
+        except orjson.JSONDecodeError:
             return default
 
+    async def get_json_cached(self, key: str, default: Any) -> Any:
+        """Like get_json, but the decoded value is shared between callers and must not be mutated."""
+        value = self._json_cache.get(key, _JSON_MISSING)
+        if value is _JSON_MISSING:
+            revision = self._revision
+            value = await self.get_json(key, _JSON_MISSING)
+            # Don't cache a read that raced with a write.
+            if revision == self._revision:
+                self._json_cache[key] = value
+        return default if value is _JSON_MISSING else value
+
     async def set_json(self, key: str, value: Any) -> None:
         conn = self._require_conn()
         now = datetime.utcnow().isoformat()
-        payload = json.dumps(value, ensure_ascii=False)
+        payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
         await conn.execute(
             """
             INSERT INTO kv(key, value, updated_at) VALUES(?, ?, ?)
@@ -735,3 +804,5 @@ class SqliteStore:
             (key, payload, now),
         )
         await conn.commit()
+        self._revision += 1
+        self._json_cache.pop(key, None)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Only needed once a command actually runs; importing the CLI entry point must not pull them in.
+_FORBIDDEN_MODULES = ("fastapi", "uvicorn", "pydantic", "yaml", "httpx")
+
+
+def test_cli_import_skips_heavy_modules() -> None:
+    out = subprocess.check_output(
+        [sys.executable, "-c", "import pt_invite_watcher.__main__, sys, json; print(json.dumps(list(sys.modules)))"],
+        cwd=_REPO_ROOT,
+    )
+    loaded = set(json.loads(out))
+    assert not [name for name in _FORBIDDEN_MODULES if name in loaded]
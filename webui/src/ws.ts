@@ -1,6 +1,6 @@
 import { onUnmounted } from "vue";
 
-export type WSEventType = "connected" | "ping" | "dashboard_update" | "logs_update" | "logs_append";
+export type WSEventType = "connected" | "ping" | "invalidate" | "dashboard_update" | "logs_update" | "logs_append";
 
 export interface WSMessage {
     type: WSEventType;
@@ -12,6 +12,13 @@ let socket: WebSocket | null = null;
 let reconnectTimer: number | undefined;
 let pingTimer: number | undefined;
 
+function dispatch(type: WSEventType, data?: any) {
+    const callbacks = listeners.get(type);
+    if (callbacks) {
+        callbacks.forEach((cb) => cb(data));
+    }
+}
+
 function connect() {
     if (socket) return;
 
@@ -35,10 +42,14 @@ function connect() {
             const msg: WSMessage = JSON.parse(event.data);
             if (msg.type === "ping") return; // Ignore pong/ping echo if any
 
-            const callbacks = listeners.get(msg.type);
-            if (callbacks) {
-                callbacks.forEach((cb) => cb(msg.data));
+            if (msg.type === "invalidate") {
+                // One frame for several topics: fan out to the matching "<topic>_update" listeners.
+                const topics: string[] = Array.isArray(msg.data?.topics) ? msg.data.topics : [];
+                topics.forEach((topic) => dispatch(`${topic}_update` as WSEventType));
+                return;
             }
+
+            dispatch(msg.type, msg.data);
         } catch (e) {
             console.warn("WS parse error:", e);
         }